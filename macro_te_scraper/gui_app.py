@@ -2,10 +2,12 @@
 
 This GUI uses Tkinter to present a small window with a single button
 that triggers the macro scraping process.  When the button is clicked,
-the script runs the same logic as `main.py`, fetching data for
-all configured countries and indicators, writing CSV/JSON outputs,
-and logging the results.  A dialog box informs the user of
-success or failure.
+the script runs the same logic as `main.py` on a background thread,
+fetching data for all configured countries and indicators, writing
+CSV/JSON outputs, and logging the results.  The window stays responsive
+while the scrape runs; a progress bar and status line underneath the
+button report progress and the final outcome, and a Cancel button stops
+the run early.  Only unexpected errors open a dialog.
 
 To build a standalone Mac application, you can use `pyinstaller` or
 `py2app`.  See the project README for guidance on packaging.
@@ -13,36 +15,119 @@ To build a standalone Mac application, you can use `pyinstaller` or
 
 from __future__ import annotations
 
+import threading
 import tkinter as tk
-from tkinter import messagebox
 import sys
+from concurrent.futures import CancelledError
+from dataclasses import dataclass, field
+from pathlib import Path
+from tkinter import ttk
+from typing import Callable, Optional
 
-# Try to import `run` from the package (when installed) first.  Fall back
-# to relative import when run inside the project directory.
-try:
-    from macro_te_scraper.src.fetcher import run  # type: ignore
-except ModuleNotFoundError:
-    from src.fetcher import run  # type: ignore
-
-
-def on_run_clicked() -> None:
-    """Callback triggered when the user clicks the run button."""
-    try:
-        exit_code = run()
-        if exit_code == 0:
-            message = (
-                "Macro data fetched successfully. \n\n"
-                "Outputs have been saved to the `output` directory."
-            )
-        else:
-            message = (
-                "Macro data fetch completed with some errors.\n\n"
-                "Please check the logs in the `logs` directory for details."
-            )
-        messagebox.showinfo("Macro Scraper", message)
-    except Exception as exc:
-        # Display unexpected exceptions to the user
-        messagebox.showerror("Error", f"An unexpected error occurred:\n{exc}")
+if not __package__:
+    # Executed as a script (``python gui_app.py``): expose the project's
+    # parent directory so the canonical ``macro_te_scraper`` package path
+    # resolves without a failing first import attempt.
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# The fetcher pulls in requests, BeautifulSoup and YAML; it is imported on
+# the first click (see `_get_run`) so the window appears immediately.
+_run: Optional[Callable[..., int]] = None
+
+
+def _get_run() -> Callable[..., int]:
+    """Import and memoise the fetcher's `run` function."""
+    global _run
+    if _run is None:
+        from macro_te_scraper.src.fetcher import run
+
+        _run = run
+    return _run
+
+
+BUTTON_TEXT = "Fetch Macro Data"
+BUTTON_TEXT_BUSY = "Fetching…"
+STATUS_SUCCESS = "Done. Outputs have been saved to the `output` directory."
+STATUS_PARTIAL = "Completed with some errors. See the `logs` directory."
+
+
+@dataclass
+class RunControls:
+    """Widgets and state shared between the Tk thread and the worker."""
+
+    root: tk.Tk
+    button: tk.Button
+    cancel_button: tk.Button
+    progress: ttk.Progressbar
+    status_var: tk.StringVar
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+
+
+def _set_idle(controls: RunControls, status: str) -> None:
+    """Re-enable the UI after a run.  Must be called on the Tk thread."""
+    controls.button.config(state="normal", text=BUTTON_TEXT)
+    controls.cancel_button.config(state="disabled")
+    controls.status_var.set(status)
+
+
+def _run_finished(controls: RunControls, exit_code: int) -> None:
+    _set_idle(controls, STATUS_SUCCESS if exit_code == 0 else STATUS_PARTIAL)
+
+
+def _run_cancelled(controls: RunControls) -> None:
+    _set_idle(controls, "Cancelled.")
+
+
+def _run_failed(controls: RunControls, exc: Exception) -> None:
+    """Re-enable the UI and report an unexpected exception."""
+    _set_idle(controls, "Failed.")
+    from tkinter import messagebox
+
+    messagebox.showerror("Error", f"An unexpected error occurred:\n{exc}")
+
+
+def _update_progress(controls: RunControls, done: int, total: int) -> None:
+    controls.progress.config(maximum=max(total, 1), value=done)
+    controls.status_var.set(f"Running... {done}/{total} indicators")
+
+
+def on_cancel_clicked(controls: RunControls) -> None:
+    """Ask the running scrape to stop at its next checkpoint."""
+    controls.cancel_event.set()
+    controls.cancel_button.config(state="disabled")
+    controls.status_var.set("Cancelling...")
+
+
+def on_run_clicked(controls: RunControls) -> None:
+    """Callback triggered when the user clicks the run button.
+
+    The button is disabled and the scrape runs on a daemon worker thread so
+    the Tk event loop keeps processing events.  Progress and completion are
+    handed back to the Tk thread with ``root.after`` because Tk widgets must
+    not be touched from other threads.
+    """
+    root = controls.root
+    controls.cancel_event.clear()
+    controls.button.config(state="disabled", text=BUTTON_TEXT_BUSY)
+    controls.cancel_button.config(state="normal")
+    controls.progress.config(value=0)
+    controls.status_var.set("Running...")
+
+    def _progress(done: int, total: int) -> None:
+        root.after(0, _update_progress, controls, done, total)
+
+    def _bg() -> None:
+        try:
+            exit_code = _get_run()(progress_cb=_progress, cancel_event=controls.cancel_event)
+        except CancelledError:
+            root.after(0, _run_cancelled, controls)
+            return
+        except Exception as exc:
+            root.after(0, _run_failed, controls, exc)
+            return
+        root.after(0, _run_finished, controls, exit_code)
+
+    threading.Thread(target=_bg, daemon=True).start()
 
 
 def main() -> None:
@@ -50,7 +135,7 @@ def main() -> None:
     root = tk.Tk()
     root.title("Trading Economics Macro Scraper")
     # Center and size the window reasonably
-    root.geometry("400x150")
+    root.geometry("400x240")
     # Create a label with instructions
     label = tk.Label(
         root,
@@ -61,18 +146,29 @@ def main() -> None:
         justify="center",
     )
     label.pack(pady=(20, 10))
-    # Create the run button
+    # Create the run and cancel buttons
+    buttons = tk.Frame(root)
+    buttons.pack()
     button = tk.Button(
-        root,
-        text="Fetch Macro Data",
+        buttons,
+        text=BUTTON_TEXT,
         width=20,
         height=2,
-        command=on_run_clicked,
     )
-    button.pack()
+    button.pack(side="left", padx=(0, 6))
+    cancel_button = tk.Button(buttons, text="Cancel", height=2, state="disabled")
+    cancel_button.pack(side="left")
+    # Progress bar and non-modal status line, updated via root.after
+    progress = ttk.Progressbar(root, length=300, mode="determinate")
+    progress.pack(pady=(12, 0))
+    status_var = tk.StringVar(value="Idle")
+    tk.Label(root, textvariable=status_var).pack(pady=(6, 0))
+    controls = RunControls(root, button, cancel_button, progress, status_var)
+    button.config(command=lambda: on_run_clicked(controls))
+    cancel_button.config(command=lambda: on_cancel_clicked(controls))
     # Start the Tkinter event loop
     root.mainloop()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
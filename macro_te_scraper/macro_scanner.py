@@ -18,7 +18,10 @@ Note: This script requires PyQt5 to be installed on the system.  Install it via
 ``config.yaml`` located in the project root, and relies on the scraping
 functions defined in the ``macro_te_scraper`` package.
 """
+import bisect
+import functools
 import sys
+from dataclasses import astuple
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent
@@ -27,20 +30,345 @@ SRC = ROOT / "src"
 sys.path.insert(0, str(SRC))
 sys.path.insert(0, str(ROOT))
 
-import yaml
-from typing import Dict, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from PyQt5 import QtWidgets, QtCore, QtGui
 
-# For trend sparklines
-from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
-from matplotlib.figure import Figure
-
-from src.sources.te_scrape import TradingEconomicsScraper
-from src.parsing.cleaners import compute_difference
-from src.parsing.validators import validate
+from src.models import MacroRow
+from src.parsing.cleaners import compute_differences
+from src.parsing.validators import validate_many
+from src.utils.cache import HttpCache
+from src.utils.config import load_config
 from src.utils.logger import setup_logger
 
+# Result table / CSV export columns; "Trend" is always last
+_HEADERS = (
+    "Country",
+    "Indicator",
+    "Current",
+    "Previous",
+    "Difference",
+    "Expected",
+    "Surprise",
+    "Published",
+    "Next Release",
+    "Trend",
+)
+
+# Clean, high-contrast white/grey/blue palette for every widget in the app
+_STYLESHEET = """
+/* --- Base --- */
+QMainWindow { background-color: #F3F4F6; }
+QWidget { color: #111827; font-size: 13px; }
+QLabel { color: #111827; }
+
+/* --- Cards / group boxes --- */
+QGroupBox {
+    background-color: #FFFFFF;
+    border: 1px solid #D1D5DB;
+    border-radius: 12px;
+    margin-top: 10px;
+    padding: 12px;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 6px;
+    font-weight: 600;
+}
+
+/* --- Tabs --- */
+QTabWidget::pane {
+    border: 1px solid #D1D5DB;
+    background: #FFFFFF;
+    border-radius: 10px;
+    padding: 0px;
+}
+QTabBar::tab {
+    background: #E5E7EB;
+    color: #111827;
+    padding: 9px 16px;
+    margin-right: 4px;
+    border-top-left-radius: 10px;
+    border-top-right-radius: 10px;
+    font-weight: 600;
+}
+QTabBar::tab:selected { background: #1976D2; color: #FFFFFF; }
+
+/* --- Inputs (Combo / LineEdit) --- */
+QComboBox, QLineEdit {
+    background: #FFFFFF;
+    color: #111827;
+    border: 1px solid #D1D5DB;
+    border-radius: 10px;
+    padding: 7px 10px;
+    min-height: 30px;
+}
+QComboBox:focus, QLineEdit:focus { border: 1px solid #1976D2; }
+
+/* Fix: dark, unreadable combo dropdown popup (macOS dark menu etc.) */
+QComboBox QAbstractItemView {
+    background-color: #FFFFFF;
+    color: #111827;
+    border: 1px solid #D1D5DB;
+    outline: 0;
+    selection-background-color: #DBEAFE;
+    selection-color: #111827;
+    padding: 4px;
+}
+QComboBox QAbstractItemView::item { padding: 6px 10px; border-radius: 6px; }
+QComboBox::drop-down {
+    subcontrol-origin: padding;
+    subcontrol-position: top right;
+    width: 28px;
+    border-left: 1px solid #D1D5DB;
+}
+
+/* --- Buttons --- */
+QPushButton {
+    background-color: #1976D2;
+    color: #FFFFFF;
+    border: none;
+    border-radius: 12px;
+    padding: 9px 14px;
+    font-weight: 700;
+}
+QPushButton:hover { background-color: #1565C0; }
+QPushButton:pressed { background-color: #0D47A1; }
+QPushButton:disabled { background-color: #9CA3AF; color: #F3F4F6; }
+
+/* --- Tables --- */
+QTableWidget {
+    background-color: #FFFFFF;
+    alternate-background-color: #F9FAFB;
+    gridline-color: #E5E7EB;
+    selection-background-color: #DBEAFE;
+    selection-color: #111827;
+    border: 1px solid #D1D5DB;
+    border-radius: 12px;
+}
+QTableWidget::item { padding: 6px; }
+QHeaderView::section {
+    background-color: #1976D2;
+    color: #FFFFFF;
+    padding: 8px 10px;
+    border: none;
+    font-weight: 700;
+}
+QTableCornerButton::section { background-color: #1976D2; border: none; }
+
+/* --- Checkboxes (Fix: tick boxes too white / low contrast) --- */
+QCheckBox { spacing: 10px; }
+QCheckBox::indicator {
+    width: 18px;
+    height: 18px;
+    border-radius: 5px;
+    border: 1px solid #9CA3AF;
+    background: #FFFFFF;
+}
+QCheckBox::indicator:hover { border: 1px solid #1976D2; }
+QCheckBox::indicator:checked {
+    border: 1px solid #1976D2;
+    background: #1976D2;
+}
+
+/* --- Scrollbars (subtle) --- */
+QScrollBar:vertical {
+    background: transparent;
+    width: 10px;
+    margin: 0px;
+}
+QScrollBar::handle:vertical {
+    background: #D1D5DB;
+    border-radius: 5px;
+    min-height: 30px;
+}
+QScrollBar::handle:vertical:hover { background: #9CA3AF; }
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; }
+QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical { background: transparent; }
+
+QScrollBar:horizontal {
+    background: transparent;
+    height: 10px;
+    margin: 0px;
+}
+QScrollBar::handle:horizontal {
+    background: #D1D5DB;
+    border-radius: 5px;
+    min-width: 30px;
+}
+QScrollBar::handle:horizontal:hover { background: #9CA3AF; }
+QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal { width: 0px; }
+QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal { background: transparent; }
+
+/* Splitter handle */
+QSplitter::handle { background: #E5E7EB; }
+"""
+
+# Alignment of numeric table cells
+_RIGHT = QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter
+
+
+# Table columns holding numbers (right-aligned)
+_NUMERIC_COLS = frozenset({2, 3, 4, 5, 6})
+
+
+class PreparedRow(NamedTuple):
+    """A result row with its table cells already rendered by the worker."""
+
+    row: MacroRow
+    texts: Tuple[str, ...]  # one per column before "Trend"
+    sparkline: Optional[QtGui.QImage]
+    trend_text: str  # shown when there is no sparkline image
+
+
+@functools.lru_cache(maxsize=256)
+def _sparkline_image(points: Tuple[float, ...]) -> QtGui.QImage:
+    """Render (and memoise) the sparkline for a tuple of trend values.
+
+    Drawn onto a ``QImage`` rather than a ``QPixmap`` so it can be rendered
+    on worker threads; the GUI thread only converts it for display.
+    Module-level so ``lru_cache`` keys on the values alone.
+    """
+    # Premultiplied ARGB is the raster paint engine's native format, so
+    # QPixmap.fromImage can adopt the pixels without a conversion pass
+    image = QtGui.QImage(60, 20, QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.transparent)
+    # Ensure we have at least two data points to plot; else leave it blank
+    if len(points) < 2:
+        return image
+    # Scale the points into the image and draw them as a polyline
+    lo, hi = min(points), max(points)
+    span = (hi - lo) or 1.0
+    step = 59 / (len(points) - 1)
+    line = QtGui.QPolygonF(
+        [QtCore.QPointF(i * step, 19 - (v - lo) * 19 / span) for i, v in enumerate(points)]
+    )
+    painter = QtGui.QPainter(image)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing)
+    painter.setPen(QtGui.QPen(QtGui.QColor("#1976d2"), 1))
+    painter.drawPolyline(line)
+    painter.end()
+    return image
+
+
+def _prepare_row(row: MacroRow) -> PreparedRow:
+    """Format a row's cells and draw its sparkline (safe off the GUI thread)."""
+    values = (
+        row.country,
+        row.indicator,
+        row.current,
+        row.previous,
+        row.difference,
+        row.expected,
+        row.surprise,
+        row.published,
+        row.next_release,
+    )
+    texts = ["" if val is None else str(val) for val in values]
+    sparkline: Optional[QtGui.QImage] = None
+    trend_text = ""
+    if row.trend and isinstance(row.trend, list):
+        try:
+            # Identical (rounded) series share one cached image
+            sparkline = _sparkline_image(tuple(round(x, 4) for x in row.trend))
+        except Exception:
+            # Fallback to text representation
+            trend_text = ", ".join(str(x) for x in row.trend)
+    return PreparedRow(row, tuple(texts), sparkline, trend_text)
+
+
+def _build_rows(
+    country: str,
+    data_map: Dict[str, Dict[str, Optional[float]]],
+    indicator_items: List[Tuple[str, Dict[str, str]]],
+) -> List[MacroRow]:
+    """Turn one country's scraped values into table rows."""
+    rows: List[MacroRow] = []
+    items = [(key, info, data_map.get(key)) for key, info in indicator_items]
+    # Range-check every scraped indicator of the country in one batch
+    validated = iter(
+        validate_many(
+            [key for key, _, values in items if values],
+            [
+                (values.get("current"), values.get("previous"), values.get("expected"))
+                for _, _, values in items
+                if values
+            ],
+        )
+    )
+    for key, info, values in items:
+        if not values:
+            # Nothing scraped for this indicator: an empty row, without
+            # running the validators or difference helpers on Nones
+            rows.append(MacroRow(country=country, indicator=info["name"]))
+            continue
+        current, previous, expected = next(validated)
+        published = values.get("published")
+        next_release = values.get("next_release")
+        trend = values.get("trend")
+        diff, surprise = compute_differences(current, previous, expected)
+        rows.append(
+            MacroRow(
+                country=country,
+                indicator=info["name"],
+                current=current,
+                previous=previous,
+                difference=diff,
+                expected=expected,
+                surprise=surprise,
+                published=published,
+                next_release=next_release,
+                trend=trend,
+            )
+        )
+    return rows
+
+
+class ScrapeSignals(QtCore.QObject):
+    """Signals emitted by :class:`ScrapeWorker` back to the GUI thread."""
+
+    rows_ready = QtCore.pyqtSignal(list)  # List[PreparedRow]
+    finished = QtCore.pyqtSignal()
+
+
+class ScrapeWorker(QtCore.QRunnable):
+    """Scrape a single country on a ``QThreadPool`` thread.
+
+    The signals object is created on the GUI thread (in ``__init__``), so
+    slots connected to it are invoked there via queued connections even
+    though ``run`` emits from a pool thread.  Rows are emitted as one batch
+    of :class:`PreparedRow` so the GUI thread only has to place the cells.
+    """
+
+    def __init__(
+        self,
+        scraper,
+        country: str,
+        indicator_items: List[Tuple[str, Dict[str, str]]],
+        logger,
+    ) -> None:
+        super().__init__()
+        self.signals = ScrapeSignals()
+        self.scraper = scraper
+        self.country = country
+        self.indicator_items = indicator_items
+        self.logger = logger
+
+    def run(self) -> None:
+        try:
+            data_map = self.scraper.fetch_all(
+                [key for key, _ in self.indicator_items], country=self.country
+            )
+            rows = _build_rows(self.country, data_map, self.indicator_items)
+            self.signals.rows_ready.emit([_prepare_row(row) for row in rows])
+        except Exception:
+            self.logger.exception("Scrape failed for %s", self.country)
+        finally:
+            self.signals.finished.emit()
+
 
 class MacroScannerApp(QtWidgets.QMainWindow):
     """Main window for the MacroScanner application."""
@@ -48,10 +376,10 @@ class MacroScannerApp(QtWidgets.QMainWindow):
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         # Load configuration
-        base_dir = Path(__file__).resolve().parents[0]
+        # Project directory (resolved once at import time)
+        self._base_dir = base_dir = ROOT
         config_path = base_dir / "config.yaml"
-        with config_path.open("r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_path)
         # Countries (assets) + display names
         # Default to the 8 currency blocs you specified: USD, EUR, GBP, JPY, AUD, CAD, NZD, CHF
         self.country_labels: Dict[str, str] = {
@@ -76,10 +404,30 @@ class MacroScannerApp(QtWidgets.QMainWindow):
         # Timeouts and rate limits
         self.timeout: int = int(config.get("timeout_seconds", 30))
         self.rate_limit: float = float(config.get("rate_limit_seconds", 2))
+        # Pages fetched within the TTL are re-read from disk, so repeat clicks
+        # (e.g. comparing the same two countries again) skip the network
+        http_cache_ttl = float(config.get("http_cache_ttl_minutes", 15))
+        self.http_cache = HttpCache(base_dir / "output" / "http_cache", ttl_seconds=http_cache_ttl * 60)
         # Set up logging
         self.logger = setup_logger(base_dir)
         # Holder for last fetched data
-        self.last_data: List[Dict[str, Optional[float]]] = []
+        self.last_data: List[MacroRow] = []
+        # Countries are scraped in parallel on the global thread pool; cap the
+        # number of simultaneous connections to tradingeconomics.com.
+        self._pool = QtCore.QThreadPool.globalInstance()
+        self._pool.setMaxThreadCount(min(8, max(1, len(self.countries))))
+        # Workers currently queued or running (keeps their signals alive)
+        self._active_workers: List[ScrapeWorker] = []
+        # One keep-alive session for the app's lifetime so every scrape reuses
+        # warm connections instead of paying a TLS handshake per request.
+        # Each country worker fetches up to four indicator pages at once.
+        self.http = requests.Session()
+        self.http.mount(
+            "https://",
+            HTTPAdapter(pool_connections=8, pool_maxsize=max(16, self._pool.maxThreadCount() * 4)),
+        )
+        # Created on the first fetch (see _get_scraper)
+        self._scraper = None
         # Build indicator map matching fetcher definition
         self.indicator_map: Dict[str, Dict[str, str]] = {
             "unemployment": {
@@ -133,11 +481,20 @@ class MacroScannerApp(QtWidgets.QMainWindow):
                 "slug": "gdp-growth",
             },
         }
+        # Configured indicators paired with their definitions, resolved once
+        # so fetches don't repeat the lookups for every country
+        self._indicator_items: List[Tuple[str, Dict[str, str]]] = []
+        for key in self.indicator_keys:
+            info = self.indicator_map.get(key)
+            if info:
+                self._indicator_items.append((key, info))
+            else:
+                self.logger.warning("Indicator %s not found in mapping", key)
         # Window settings
         self.setWindowTitle("MacroScanner")
         self.resize(1024, 768)
         # Load and set application icon from the bundled logo
-        logo_path = Path(__file__).resolve().parents[0] / "assets" / "logo.png"
+        logo_path = self._base_dir / "assets" / "logo.png"
         if logo_path.exists():
             self.logo_pixmap = QtGui.QPixmap(str(logo_path))
             if not self.logo_pixmap.isNull():
@@ -154,9 +511,7 @@ class MacroScannerApp(QtWidgets.QMainWindow):
         try:
             if hasattr(self, "logo_pixmap") and not self.logo_pixmap.isNull():
                 logo_label = QtWidgets.QLabel()
-                # Scale logo to fit nicely; maintain aspect ratio
-                scaled = self.logo_pixmap.scaledToHeight(80, QtCore.Qt.SmoothTransformation)
-                logo_label.setPixmap(scaled)
+                logo_label.setPixmap(self._header_logo())
                 logo_label.setAlignment(QtCore.Qt.AlignCenter)
                 layout.addWidget(logo_label)
         except Exception:
@@ -175,157 +530,37 @@ class MacroScannerApp(QtWidgets.QMainWindow):
         # Apply stylesheet for color palette
         self._apply_styles()
 
-    def _apply_styles(self) -> None:
-        """Apply a clean, high-contrast palette + widget styling."""
-        style = """
-        /* --- Base --- */
-        QMainWindow { background-color: #F3F4F6; }
-        QWidget { color: #111827; font-size: 13px; }
-        QLabel { color: #111827; }
-
-        /* --- Cards / group boxes --- */
-        QGroupBox {
-            background-color: #FFFFFF;
-            border: 1px solid #D1D5DB;
-            border-radius: 12px;
-            margin-top: 10px;
-            padding: 12px;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 6px;
-            font-weight: 600;
-        }
-
-        /* --- Tabs --- */
-        QTabWidget::pane {
-            border: 1px solid #D1D5DB;
-            background: #FFFFFF;
-            border-radius: 10px;
-            padding: 0px;
-        }
-        QTabBar::tab {
-            background: #E5E7EB;
-            color: #111827;
-            padding: 9px 16px;
-            margin-right: 4px;
-            border-top-left-radius: 10px;
-            border-top-right-radius: 10px;
-            font-weight: 600;
-        }
-        QTabBar::tab:selected { background: #1976D2; color: #FFFFFF; }
-
-        /* --- Inputs (Combo / LineEdit) --- */
-        QComboBox, QLineEdit {
-            background: #FFFFFF;
-            color: #111827;
-            border: 1px solid #D1D5DB;
-            border-radius: 10px;
-            padding: 7px 10px;
-            min-height: 30px;
-        }
-        QComboBox:focus, QLineEdit:focus { border: 1px solid #1976D2; }
-
-        /* Fix: dark, unreadable combo dropdown popup (macOS dark menu etc.) */
-        QComboBox QAbstractItemView {
-            background-color: #FFFFFF;
-            color: #111827;
-            border: 1px solid #D1D5DB;
-            outline: 0;
-            selection-background-color: #DBEAFE;
-            selection-color: #111827;
-            padding: 4px;
-        }
-        QComboBox QAbstractItemView::item { padding: 6px 10px; border-radius: 6px; }
-        QComboBox::drop-down {
-            subcontrol-origin: padding;
-            subcontrol-position: top right;
-            width: 28px;
-            border-left: 1px solid #D1D5DB;
-        }
-
-        /* --- Buttons --- */
-        QPushButton {
-            background-color: #1976D2;
-            color: #FFFFFF;
-            border: none;
-            border-radius: 12px;
-            padding: 9px 14px;
-            font-weight: 700;
-        }
-        QPushButton:hover { background-color: #1565C0; }
-        QPushButton:pressed { background-color: #0D47A1; }
-        QPushButton:disabled { background-color: #9CA3AF; color: #F3F4F6; }
-
-        /* --- Tables --- */
-        QTableWidget {
-            background-color: #FFFFFF;
-            alternate-background-color: #F9FAFB;
-            gridline-color: #E5E7EB;
-            selection-background-color: #DBEAFE;
-            selection-color: #111827;
-            border: 1px solid #D1D5DB;
-            border-radius: 12px;
-        }
-        QTableWidget::item { padding: 6px; }
-        QHeaderView::section {
-            background-color: #1976D2;
-            color: #FFFFFF;
-            padding: 8px 10px;
-            border: none;
-            font-weight: 700;
-        }
-        QTableCornerButton::section { background-color: #1976D2; border: none; }
-
-        /* --- Checkboxes (Fix: tick boxes too white / low contrast) --- */
-        QCheckBox { spacing: 10px; }
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-            border-radius: 5px;
-            border: 1px solid #9CA3AF;
-            background: #FFFFFF;
-        }
-        QCheckBox::indicator:hover { border: 1px solid #1976D2; }
-        QCheckBox::indicator:checked {
-            border: 1px solid #1976D2;
-            background: #1976D2;
-        }
-
-        /* --- Scrollbars (subtle) --- */
-        QScrollBar:vertical {
-            background: transparent;
-            width: 10px;
-            margin: 0px;
-        }
-        QScrollBar::handle:vertical {
-            background: #D1D5DB;
-            border-radius: 5px;
-            min-height: 30px;
-        }
-        QScrollBar::handle:vertical:hover { background: #9CA3AF; }
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; }
-        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical { background: transparent; }
-
-        QScrollBar:horizontal {
-            background: transparent;
-            height: 10px;
-            margin: 0px;
-        }
-        QScrollBar::handle:horizontal {
-            background: #D1D5DB;
-            border-radius: 5px;
-            min-width: 30px;
-        }
-        QScrollBar::handle:horizontal:hover { background: #9CA3AF; }
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal { width: 0px; }
-        QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal { background: transparent; }
+    def _header_logo(self) -> QtGui.QPixmap:
+        """Return the logo scaled to the 80 px header height.
 
-        /* Splitter handle */
-        QSplitter::handle { background: #E5E7EB; }
+        The smooth rescale of the full-size logo is done once and saved as
+        ``output/ui_cache/logo_80.png``; later launches load that file
+        directly unless ``logo.png`` has been modified since.  Nothing is
+        written into the install tree.
         """
-        self.setStyleSheet(style)
+        source = self._base_dir / "assets" / "logo.png"
+        cached = self._base_dir / "output" / "ui_cache" / "logo_80.png"
+        try:
+            if cached.stat().st_mtime >= source.stat().st_mtime:
+                pixmap = QtGui.QPixmap(str(cached))
+                if not pixmap.isNull():
+                    return pixmap
+        except OSError:
+            pass
+        # Scale logo to fit nicely; maintain aspect ratio
+        scaled = self.logo_pixmap.scaledToHeight(80, QtCore.Qt.SmoothTransformation)
+        # Best effort: without a writable output folder the logo is simply
+        # rescaled again on the next launch
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            scaled.save(str(cached), "PNG")
+        except OSError:
+            pass
+        return scaled
+
+    def _apply_styles(self) -> None:
+        """Apply a clean, high-contrast palette + widget styling."""
+        self.setStyleSheet(_STYLESHEET)
 
     def _display_country(self, slug: str) -> str:
         """Return a user-friendly name for a country slug."""
@@ -362,20 +597,8 @@ class MacroScannerApp(QtWidgets.QMainWindow):
         self.full_table = QtWidgets.QTableWidget()
         layout.addWidget(self.full_table)
         # Set column headers
-        headers = [
-            "Country",
-            "Indicator",
-            "Current",
-            "Previous",
-            "Difference",
-            "Expected",
-            "Surprise",
-            "Published",
-            "Next Release",
-            "Trend",
-        ]
-        self.full_table.setColumnCount(len(headers))
-        self.full_table.setHorizontalHeaderLabels(headers)
+        self.full_table.setColumnCount(len(_HEADERS))
+        self.full_table.setHorizontalHeaderLabels(list(_HEADERS))
         self.full_table.horizontalHeader().setStretchLastSection(True)
         self.full_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.full_table.verticalHeader().setVisible(False)
@@ -395,16 +618,16 @@ class MacroScannerApp(QtWidgets.QMainWindow):
         if not selected_countries:
             QtWidgets.QMessageBox.warning(self, "No Countries Selected", "Please select at least one country.")
             return
-        # Disable buttons while fetching
+        # Disable buttons while fetching; they are re-enabled once every
+        # country's worker has finished.
         self.fetch_selected_btn.setDisabled(True)
-        QtWidgets.QApplication.processEvents()
-        try:
-            data = self._fetch_data(selected_countries)
-            self.last_data = data  # store for export
-            self._populate_table(self.full_table, data)
-            self.export_btn.setDisabled(False)
-        finally:
-            self.fetch_selected_btn.setDisabled(False)
+        self.export_btn.setDisabled(True)
+        self.last_data = self._fetch_data(selected_countries, self.full_table, self._on_full_fetched)
+
+    def _on_full_fetched(self, rows: List[MacroRow]) -> None:
+        """Re-enable the Full List controls after a fetch completes."""
+        self.export_btn.setDisabled(not rows)
+        self.fetch_selected_btn.setDisabled(False)
 
     def _on_export(self) -> None:
         """Export the currently displayed data to a CSV file chosen by the user."""
@@ -417,51 +640,33 @@ class MacroScannerApp(QtWidgets.QMainWindow):
             return
         # Write CSV
         try:
-            headers = [
-                "Country",
-                "Indicator",
-                "Current",
-                "Previous",
-                "Difference",
-                "Expected",
-                "Surprise",
-                "Published",
-                "Next Release",
-                "Trend",
-            ]
             import csv
-            with open(path, "w", newline="", encoding="utf-8") as f:
+            with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
                 writer = csv.writer(f)
-                writer.writerow(headers)
-                for row in self.last_data:
-                    trend_str = ""  # convert trend list to string
-                    if row.get("Trend"):
-                        trend_str = ", ".join(str(x) for x in row.get("Trend"))
-                    writer.writerow([
-                        row.get("Country", ""),
-                        row.get("Indicator", ""),
-                        row.get("Current", ""),
-                        row.get("Previous", ""),
-                        row.get("Difference", ""),
-                        row.get("Expected", ""),
-                        row.get("Surprise", ""),
-                        row.get("Published", ""),
-                        row.get("Next Release", ""),
-                        trend_str,
-                    ])
+                writer.writerow(_HEADERS)
+                writer.writerows(self._rows_iter(self.last_data))
             QtWidgets.QMessageBox.information(self, "Export Complete", f"Data exported to {path}")
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Export Failed", f"An error occurred while exporting: {e}")
 
+    @staticmethod
+    def _rows_iter(rows: List[MacroRow]):
+        """Yield CSV records for ``rows`` in ``_HEADERS`` column order."""
+        for row in rows:
+            # Trend list (last field) is flattened into a single
+            # comma-separated cell
+            *values, trend = astuple(row)
+            values.append(", ".join(str(x) for x in trend) if trend else "")
+            yield values
+
     def _on_full_start(self) -> None:
         """Handle click on the fetch all button."""
         self.full_start_btn.setDisabled(True)
-        QtWidgets.QApplication.processEvents()
-        try:
-            data = self._fetch_data(self.countries)
-            self._populate_table(self.full_table, data)
-        finally:
-            self.full_start_btn.setDisabled(False)
+        self._fetch_data(
+            self.countries,
+            self.full_table,
+            lambda _rows: self.full_start_btn.setDisabled(False),
+        )
 
     # --------------- Compare Tab ---------------
     def _init_compare_tab(self) -> None:
@@ -505,19 +710,6 @@ class MacroScannerApp(QtWidgets.QMainWindow):
         layout.addLayout(btn_row)
 
         # --- Two result tables stacked vertically (better for comparison) ---
-        headers = [
-            "Country",
-            "Indicator",
-            "Current",
-            "Previous",
-            "Difference",
-            "Expected",
-            "Surprise",
-            "Published",
-            "Next Release",
-            "Trend",
-        ]
-
         self.compare_label_top = QtWidgets.QLabel("Asset 1 results")
         self.compare_label_top.setStyleSheet("font-weight: 700; font-size: 14px;")
         self.compare_label_bottom = QtWidgets.QLabel("Asset 2 results")
@@ -526,8 +718,8 @@ class MacroScannerApp(QtWidgets.QMainWindow):
         self.table_left = QtWidgets.QTableWidget()
         self.table_right = QtWidgets.QTableWidget()
         for tbl in (self.table_left, self.table_right):
-            tbl.setColumnCount(len(headers))
-            tbl.setHorizontalHeaderLabels(headers)
+            tbl.setColumnCount(len(_HEADERS))
+            tbl.setHorizontalHeaderLabels(list(_HEADERS))
             tbl.horizontalHeader().setStretchLastSection(True)
             tbl.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
             tbl.verticalHeader().setVisible(False)
@@ -562,155 +754,127 @@ class MacroScannerApp(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.warning(self, "Invalid Selection", "Please select two different assets.")
             return
         self.compare_btn.setDisabled(True)
-        QtWidgets.QApplication.processEvents()
-        try:
-            data1 = self._fetch_data([str(slug1)])
-            data2 = self._fetch_data([str(slug2)])
-            self._populate_table(self.table_left, data1)
-            self._populate_table(self.table_right, data2)
-            # Update section labels using the user-friendly names
-            self.compare_label_top.setText(self.combo1.currentText())
-            self.compare_label_bottom.setText(self.combo2.currentText())
-        finally:
-            self.compare_btn.setDisabled(False)
+        # Update section labels using the user-friendly names
+        self.compare_label_top.setText(self.combo1.currentText())
+        self.compare_label_bottom.setText(self.combo2.currentText())
+        # Both assets are fetched concurrently; re-enable once both are done.
+        remaining = [2]
 
-    # --------------- Data Fetching and Display ---------------
-    def _fetch_data(self, country_list: List[str]) -> List[Dict[str, Optional[float]]]:
-        """Fetch macro data for the given list of countries.
+        def _side_done(_rows: List[MacroRow]) -> None:
+            remaining[0] -= 1
+            if not remaining[0]:
+                self.compare_btn.setDisabled(False)
+
+        self._fetch_data([str(slug1)], self.table_left, _side_done)
+        self._fetch_data([str(slug2)], self.table_right, _side_done)
 
-        Returns a list of dictionaries representing rows for the table.
+    # --------------- Data Fetching and Display ---------------
+    def _fetch_data(
+        self,
+        country_list: List[str],
+        table: QtWidgets.QTableWidget,
+        on_finished: Callable[[List[MacroRow]], None],
+    ) -> List[MacroRow]:
+        """Start fetching macro data for the given countries in the background.
+
+        One :class:`ScrapeWorker` per country is dispatched to the thread pool.
+        Each country's rows are inserted into ``table`` as they arrive, at
+        their position in ``country_list`` order, so every cell is built once
+        and the table is already ordered when the last worker finishes and
+        ``on_finished`` is called with the rows.  The returned list is filled
+        in place, in the same order, as rows arrive.
         """
-        rows: List[Dict[str, Optional[float]]] = []
+        rows: List[MacroRow] = []
+        # country_list index of each row in ``rows``, kept sorted
+        ranks: List[int] = []
+        remaining = [len(country_list)]
+        order = {country: idx for idx, country in enumerate(country_list)}
+        table.setRowCount(0)
+
+        def _on_rows(batch: List[PreparedRow]) -> None:
+            if not batch:
+                return
+            # A batch holds one country's rows: place them after the rows of
+            # every country listed before it
+            rank = order.get(batch[0].row.country, len(order))
+            position = bisect.bisect_right(ranks, rank)
+            ranks[position:position] = [rank] * len(batch)
+            rows[position:position] = [p.row for p in batch]
+            self._insert_rows(table, position, batch)
+
+        def _on_worker_finished(worker: ScrapeWorker) -> None:
+            self._active_workers.remove(worker)
+            remaining[0] -= 1
+            if not remaining[0]:
+                on_finished(rows)
+
+        if not country_list:
+            on_finished(rows)
+            return rows
+        scraper = self._get_scraper()
         for country in country_list:
-            scraper = TradingEconomicsScraper(
-                country_slug=country,
+            worker = ScrapeWorker(scraper, country, self._indicator_items, self.logger)
+            worker.signals.rows_ready.connect(_on_rows)
+            worker.signals.finished.connect(lambda w=worker: _on_worker_finished(w))
+            self._active_workers.append(worker)
+            self._pool.start(worker)
+        return rows
+
+    def _get_scraper(self):
+        """Return the scraper shared by every fetch, creating it on first use.
+
+        One instance serves all countries (the country is passed per call),
+        so its session headers, connection pool and HTTP cache are set up
+        once.  The import is deferred until then because BeautifulSoup and
+        its parser are slow to load and not needed to show the window.
+        """
+        if self._scraper is None:
+            from src.sources.te_scrape import TradingEconomicsScraper
+
+            self._scraper = TradingEconomicsScraper(
+                country_slug=None,
                 indicator_map=self.indicator_map,
                 timeout=self.timeout,
                 rate_limit=self.rate_limit,
                 logger=self.logger,
-                base_dir=Path(__file__).resolve().parents[0],
+                base_dir=self._base_dir,
+                session=self.http,
+                http_cache=self.http_cache,
             )
-            data_map = scraper.fetch_all(self.indicator_keys)
-            for key in self.indicator_keys:
-                info = self.indicator_map.get(key)
-                if not info:
-                    continue
-                values = data_map.get(key) or {
-                    "current": None,
-                    "previous": None,
-                    "expected": None,
-                    "published": None,
-                    "next_release": None,
-                    "trend": None,
-                }
-                current = validate(key, values.get("current"))
-                previous = validate(key, values.get("previous"))
-                expected = validate(key, values.get("expected"))
-                published = values.get("published")
-                next_release = values.get("next_release")
-                trend = values.get("trend")
-                diff = compute_difference(current, previous)
-                surprise = compute_difference(current, expected) if expected is not None else None
-                row_dict = {
-                    "Country": country,
-                    "Indicator": info["name"],
-                    "Current": current,
-                    "Previous": previous,
-                    "Difference": diff,
-                    "Expected": expected,
-                    "Surprise": surprise,
-                    "Published": published,
-                    "Next Release": next_release,
-                }
-                if trend is not None:
-                    row_dict["Trend"] = trend
-                rows.append(row_dict)
-        return rows
+        return self._scraper
 
-    def _populate_table(self, table: QtWidgets.QTableWidget, data: List[Dict[str, Optional[float]]]) -> None:
-        """Populate a QTableWidget with the provided data rows."""
-        table.setRowCount(len(data))
-        for row_idx, row in enumerate(data):
-            # Build list of values in order of columns
-            values = [
-                row.get("Country", ""),
-                row.get("Indicator", ""),
-                row.get("Current", ""),
-                row.get("Previous", ""),
-                row.get("Difference", ""),
-                row.get("Expected", ""),
-                row.get("Surprise", ""),
-                row.get("Published", ""),
-                row.get("Next Release", ""),
-            ]
-            # Trend values may be a list of floats; use placeholder string or sparkline
-            trend_data = row.get("Trend")
-            # Set up cells
-            for col_idx, val in enumerate(values):
-                item = QtWidgets.QTableWidgetItem(str(val))
-                if col_idx in {2, 3, 4, 5, 6}:  # numeric columns
-                    item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-                table.setItem(row_idx, col_idx, item)
-            # Trend column (last)
-            trend_col = len(values)
-            if trend_data and isinstance(trend_data, list):
-                try:
-                    pixmap = self._create_sparkline(trend_data)
-                    label = QtWidgets.QLabel()
-                    label.setAlignment(QtCore.Qt.AlignCenter)
-                    label.setPixmap(pixmap)
-                    table.setCellWidget(row_idx, trend_col, label)
-                except Exception:
-                    # Fallback to text representation
-                    item = QtWidgets.QTableWidgetItem(
-                        ", ".join(str(x) for x in trend_data)
-                    )
-                    table.setItem(row_idx, trend_col, item)
-            else:
-                # Empty cell
-                table.setItem(row_idx, trend_col, QtWidgets.QTableWidgetItem(""))
+    def _insert_rows(
+        self, table: QtWidgets.QTableWidget, position: int, batch: List[PreparedRow]
+    ) -> None:
+        """Insert a batch of prepared rows into a QTableWidget at ``position``.
 
-    def _create_sparkline(self, data: List[float]) -> QtGui.QPixmap:
+        Repaints are suspended while the batch is added so the table lays
+        itself out once per batch instead of after every cell.
         """
-        Create a small sparkline QPixmap from a list of numeric data.
-
-        Parameters
-        ----------
-        data : list of float
-            List of numeric values (up to 6) to plot.
-
-        Returns
-        -------
-        QPixmap
-            The rendered sparkline image.
-        """
-        # Ensure we have at least two data points to plot
-        if not data or len(data) < 2:
-            # Create a blank pixmap
-            pix = QtGui.QPixmap(60, 20)
-            pix.fill(QtGui.QColor("transparent"))
-            return pix
-        # Create matplotlib figure
-        fig = Figure(figsize=(1.2, 0.4), dpi=100)
-        canvas = FigureCanvas(fig)
-        ax = fig.add_axes([0, 0, 1, 1])
-        ax.plot(data, linewidth=1, color="#1976d2")
-        ax.set_xticks([])
-        ax.set_yticks([])
-        for spine in ax.spines.values():
-            spine.set_visible(False)
-        fig.tight_layout(pad=0)
-        # Draw figure and convert to QPixmap
-        canvas.draw()
-        width, height = fig.canvas.get_width_height()
-        image = QtGui.QImage(canvas.buffer_rgba(), width, height, QtGui.QImage.Format_RGBA8888)
-        pixmap = QtGui.QPixmap.fromImage(image)
-        return pixmap
-
-    
-    # The `_create_sparkline` helper is defined below within the class.  It generates a
-    # small line chart (sparkline) from a list of values for display in the table.
-    
+        table.setUpdatesEnabled(False)
+        try:
+            for offset, prepared in enumerate(batch):
+                table.insertRow(position + offset)
+                self._fill_row(table, position + offset, prepared)
+        finally:
+            table.setUpdatesEnabled(True)
+
+    def _fill_row(self, table: QtWidgets.QTableWidget, row_idx: int, prepared: PreparedRow) -> None:
+        """Place the pre-rendered cells of one row into the table."""
+        for col_idx, text in enumerate(prepared.texts):
+            item = QtWidgets.QTableWidgetItem(text)
+            if col_idx in _NUMERIC_COLS:
+                item.setTextAlignment(_RIGHT)
+            table.setItem(row_idx, col_idx, item)
+        # Trend column (last)
+        trend_col = len(prepared.texts)
+        if prepared.sparkline is not None:
+            label = QtWidgets.QLabel()
+            label.setAlignment(QtCore.Qt.AlignCenter)
+            label.setPixmap(QtGui.QPixmap.fromImage(prepared.sparkline))
+            table.setCellWidget(row_idx, trend_col, label)
+        else:
+            table.setItem(row_idx, trend_col, QtWidgets.QTableWidgetItem(prepared.trend_text))
 
 
 def main() -> None:
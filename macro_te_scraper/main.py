@@ -2,20 +2,20 @@
 
 This script simply forwards to :func:`macro_te_scraper.src.fetcher.run` and
 exits with the returned status code.  It exists as a thin wrapper to allow
-`python main.py` execution from the project root without manipulating
-PYTHONPATH.
+`python main.py` execution from the project root without setting
+PYTHONPATH: when run as a script it prepends the project's parent directory
+to ``sys.path`` itself so the ``macro_te_scraper`` package can be imported.
 """
 
 import sys
+from pathlib import Path
 
-try:
-    # When executed via `python -m macro_te_scraper.main` from parent directory,
-    # import using the package name.
-    from macro_te_scraper.src.fetcher import run  # type: ignore
-except ModuleNotFoundError:
-    # When executed via `python main.py` from within the macro_te_scraper folder,
-    # fall back to a relative import.
-    from src.fetcher import run  # type: ignore
+if not __package__:
+    # Executed as a script (``python main.py``): expose the project's parent
+    # directory so the canonical package path below resolves.
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from macro_te_scraper.src.fetcher import run
 
 
 def main() -> int:
@@ -8,28 +8,232 @@ invoked by `main.py`.
 
 from __future__ import annotations
 
+import atexit
+import logging
 import sys
-import yaml
+import threading
+from concurrent.futures import FIRST_COMPLETED, CancelledError, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
+from .models import MacroRow
 from .utils.logger import setup_logger
-from .utils.cache import Cache
-from .parsing.cleaners import compute_difference
-from .parsing.validators import validate
-from .utils.table import print_and_save
-from .sources.te_scrape import TradingEconomicsScraper
-from .sources.te_api import TradingEconomicsAPI
+from .utils.cache import Cache, HttpCache
+from .utils.config import load_config
+from .parsing.cleaners import compute_differences
+from .parsing.validators import validate_many
+from .utils.table import PARQUET_AVAILABLE, print_and_save
 
+# requests and the source modules (which pull in BeautifulSoup) are imported
+# where they are first needed: a run only uses one source, and a run served
+# entirely from the cache needs neither.
+if TYPE_CHECKING:
+    import requests
 
-def load_config(config_path: Path) -> Dict:
-    """Load YAML configuration file."""
-    with config_path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+# Indicator mapping central definition – names, slugs and expected URLs.
+# Do not reference a country here; expected values are fetched by combining
+# the country and the indicator slug inside the scraper.
+# ``ttl_minutes`` overrides the global ``cache_ttl_minutes`` for indicators
+# whose release cadence makes a shorter or longer cache lifetime sensible.
+INDICATOR_MAP: Dict[str, Dict[str, Any]] = {
+    "unemployment": {
+        "name": "Unemployment",
+        "row_label": "Unemployment Rate",
+        "slug": "unemployment-rate",
+        "ttl_minutes": 360,
+    },
+    "inflation_mom": {
+        "name": "Inflation MoM",
+        "row_label": "Inflation Rate MoM",
+        "slug": "inflation-rate-mom",
+        "ttl_minutes": 360,
+    },
+    # Year-over-year inflation (annual inflation rate)
+    "inflation_yoy": {
+        "name": "Inflation YoY",
+        "row_label": "Inflation Rate",
+        # tradingeconomics slug for inflation rate (CPI YoY). TE uses 'inflation-cpi'
+        "slug": "inflation-cpi",
+        "ttl_minutes": 360,
+    },
+    "interest_rate": {
+        "name": "Interest Rate",
+        "row_label": "Interest Rate",
+        "slug": "interest-rate",
+        "ttl_minutes": 1440,
+    },
+    "retail_sales_mom": {
+        "name": "Retail Sales MoM",
+        "row_label": "Retail Sales MoM",
+        "slug": "retail-sales-mom",
+        "ttl_minutes": 360,
+    },
+    # Year-over-year retail sales
+    "retail_sales_yoy": {
+        "name": "Retail Sales YoY",
+        "row_label": "Retail Sales YoY",
+        "slug": "retail-sales-yoy",
+        "ttl_minutes": 360,
+    },
+    "services_pmi": {
+        "name": "Services PMI",
+        "row_label": "Services PMI",
+        "slug": "services-pmi",
+        "ttl_minutes": 60,
+    },
+    "manufacturing_pmi": {
+        "name": "Manufacturing PMI",
+        "row_label": "Manufacturing PMI",
+        "slug": "manufacturing-pmi",
+        "ttl_minutes": 60,
+    },
+    "ppi": {
+        "name": "PPI",
+        "row_label": "Producer Price Inflation MoM",
+        "slug": "producer-price-inflation-mom",
+        "ttl_minutes": 360,
+    },
+    "gdp_growth_qoq": {
+        "name": "GDP Growth QoQ",
+        "row_label": "GDP Growth Rate",
+        "slug": "gdp-growth",
+        "ttl_minutes": 1440,
+    },
+}
 
+# HTTP session shared by every run in this process.  Keeping it at module
+# scope means repeated runs (e.g. GUI clicks) reuse warm keep-alive
+# connections instead of paying a new TCP+TLS handshake per request.  Status
+# based retries (429/5xx) are still handled by the sources themselves; the
+# adapter only retries transport-level (connect/read) failures.
+_SESSION: Optional[requests.Session] = None
+_SESSION_POOL_SIZE = 0
+_SESSION_LOCK = threading.Lock()
 
-def run() -> int:
-    """Main entry point for running the scraper.  Returns exit code."""
+
+def _get_session(pool_maxsize: int) -> requests.Session:
+    """Return the shared session, resizing its connection pool if needed.
+
+    Every request goes to the same Trading Economics host, so the per-host
+    pool must be at least as large as the number of concurrent fetches;
+    otherwise excess connections are opened and thrown away after each use.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    global _SESSION, _SESSION_POOL_SIZE
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = requests.Session()
+            atexit.register(_SESSION.close)
+        if _SESSION_POOL_SIZE != pool_maxsize:
+            old_adapter = _SESSION.adapters.get("https://")
+            _SESSION.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=pool_maxsize,
+                    max_retries=Retry(total=3, backoff_factor=0.3),
+                ),
+            )
+            if old_adapter is not None:
+                old_adapter.close()
+            _SESSION_POOL_SIZE = pool_maxsize
+        return _SESSION
+
+
+# Worker pool for concurrent scraping, kept for the life of the process so
+# repeated runs (e.g. GUI clicks) reuse warm threads.  Created lazily and
+# rebuilt only when the configured size changes.
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_SIZE = 0
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Return the shared worker pool, resizing it if ``max_workers`` changed."""
+    global _EXECUTOR, _EXECUTOR_SIZE
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None or _EXECUTOR_SIZE != max_workers:
+            if _EXECUTOR is not None:
+                _EXECUTOR.shutdown(wait=False)
+            _EXECUTOR = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="macro-fetch")
+            _EXECUTOR_SIZE = max_workers
+        return _EXECUTOR
+
+
+def scrape_country(
+    country: str,
+    indicator_keys: List[str],
+    timeout: int,
+    rate_limit: float,
+    logger,
+    base_dir: Path,
+    session: Optional[requests.Session] = None,
+    http_cache: Optional[HttpCache] = None,
+    cancel_event: Optional[threading.Event] = None,
+    page_concurrency: int = 4,
+) -> Dict:
+    """Scrape the raw indicator values for a single country.
+
+    Module-level (rather than a closure inside :func:`run`) so it can be
+    handed to any ``concurrent.futures`` executor.
+    """
+    from .sources.te_scrape import TradingEconomicsScraper
+
+    scraper = TradingEconomicsScraper(
+        country,
+        INDICATOR_MAP,
+        timeout,
+        rate_limit,
+        logger,
+        base_dir,
+        session=session,
+        http_cache=http_cache,
+        max_workers=page_concurrency,
+    )
+    return scraper.fetch_all(indicator_keys, cancel_event=cancel_event)
+
+
+# Guards against overlapping runs in one process (e.g. repeated GUI clicks),
+# which would contend for the connection pool and the output files.
+_RUN_LOCK = threading.Lock()
+
+
+def run(
+    progress_cb: Optional[Callable[[int, int], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> int:
+    """Main entry point for running the scraper.  Returns exit code.
+
+    Parameters
+    ----------
+    progress_cb : callable, optional
+        Called as ``progress_cb(done, total)`` each time a country's
+        indicators have been processed; ``total`` is the number of
+        (country, indicator) pairs in the run.
+    cancel_event : threading.Event, optional
+        Checked between countries and between indicators.  Once set, pending
+        work is abandoned, no output is written and
+        :class:`concurrent.futures.CancelledError` is raised.
+
+    Returns 1 immediately if another run is already in progress.
+    """
+    if not _RUN_LOCK.acquire(blocking=False):
+        logging.getLogger("macro_scraper").warning("A run is already in progress; skipping.")
+        return 1
+    try:
+        return _run(progress_cb, cancel_event)
+    finally:
+        _RUN_LOCK.release()
+
+
+def _run(
+    progress_cb: Optional[Callable[[int, int], None]],
+    cancel_event: Optional[threading.Event],
+) -> int:
+    """Perform a single scrape and write the outputs."""
     # Determine base directory (two levels up from this file)
     base_dir = Path(__file__).resolve().parents[1]
     config_path = base_dir / "config.yaml"
@@ -47,134 +251,217 @@ def run() -> int:
     timeout = int(config.get("timeout_seconds", 30))
     rate_limit = float(config.get("rate_limit_seconds", 2))
     cache_ttl = int(config.get("cache_ttl_minutes", 60))
-
-    # Indicator mapping central definition – names, slugs and expected URLs
-    # Define indicator metadata.  Do not reference `country` here because it is
-    # set only within the loop below.  Expected values will be fetched by
-    # combining the country and the indicator slug inside the scraper.
-    INDICATOR_MAP: Dict[str, Dict[str, str]] = {
-        "unemployment": {
-            "name": "Unemployment",
-            "row_label": "Unemployment Rate",
-            "slug": "unemployment-rate",
-        },
-        "inflation_mom": {
-            "name": "Inflation MoM",
-            "row_label": "Inflation Rate MoM",
-            "slug": "inflation-rate-mom",
-        },
-        # Year-over-year inflation (annual inflation rate)
-        "inflation_yoy": {
-            "name": "Inflation YoY",
-            "row_label": "Inflation Rate",
-            # tradingeconomics slug for inflation rate (CPI YoY). TE uses 'inflation-cpi'
-            "slug": "inflation-cpi",
-        },
-        "interest_rate": {
-            "name": "Interest Rate",
-            "row_label": "Interest Rate",
-            "slug": "interest-rate",
-        },
-        "retail_sales_mom": {
-            "name": "Retail Sales MoM",
-            "row_label": "Retail Sales MoM",
-            "slug": "retail-sales-mom",
-        },
-        # Year-over-year retail sales
-        "retail_sales_yoy": {
-            "name": "Retail Sales YoY",
-            "row_label": "Retail Sales YoY",
-            "slug": "retail-sales-yoy",
-        },
-        "services_pmi": {
-            "name": "Services PMI",
-            "row_label": "Services PMI",
-            "slug": "services-pmi",
-        },
-        "manufacturing_pmi": {
-            "name": "Manufacturing PMI",
-            "row_label": "Manufacturing PMI",
-            "slug": "manufacturing-pmi",
-        },
-        "ppi": {
-            "name": "PPI",
-            "row_label": "Producer Price Inflation MoM",
-            "slug": "producer-price-inflation-mom",
-        },
-        "gdp_growth_qoq": {
-            "name": "GDP Growth QoQ",
-            "row_label": "GDP Growth Rate",
-            "slug": "gdp-growth",
-        },
-    }
+    # How long fetched pages are reused from disk before being revalidated
+    http_cache_ttl = float(config.get("http_cache_ttl_minutes", 15))
+    # Further window in which expired API responses are served immediately
+    # and refreshed in the background
+    http_cache_stale = float(config.get("http_cache_stale_minutes", 0))
+    # Upper bound on countries fetched in parallel.  The work is dominated by
+    # network latency, so a small thread pool overlaps the round-trips.
+    max_concurrency = int(config.get("max_concurrency", 8))
+    # Indicator detail pages fetched in parallel within each country
+    page_concurrency = int(config.get("page_concurrency", 4))
+    # Size of the keep-alive connection pool to the Trading Economics host
+    max_connections = int(config.get("max_connections", 32))
+    # Output formats written under output/ ("csv", "json" and/or "parquet")
+    output_formats = {str(f).lower() for f in config.get("output_formats", ["csv", "json"])}
+    if "parquet" in output_formats and not PARQUET_AVAILABLE:
+        logger.warning("Parquet output requested but pyarrow is not installed; skipping it.")
 
     # Prepare cache (one file for all countries)
     cache_file = base_dir / "output" / "cache.json"
     cache = Cache(cache_file, ttl_minutes=cache_ttl)
+    # Raw page bodies plus their ETag/Last-Modified validators, used for
+    # conditional GETs when a cached value has expired
+    http_cache = HttpCache(
+        base_dir / "output" / "http_cache",
+        ttl_seconds=http_cache_ttl * 60,
+        stale_seconds=http_cache_stale * 60,
+    )
+
+    if source == "api" and not api_key:
+        logger.error("API source selected but no api_key provided in config.")
+        return 1
 
-    rows = []
-    successes = 0
-    # Iterate through each country
+    # Serve fresh values straight from the cache and only go to the network
+    # for the (country, indicator) pairs that are missing or expired.
+    cached_values: Dict[str, Dict[str, Dict]] = {}
+    missing: Dict[str, List[str]] = {}
     for country in countries:
-        # Determine source-specific client per country (for API we reuse same client but pass country later)
-        if source == "api":
-            if not api_key:
-                logger.error("API source selected but no api_key provided in config.")
-                return 1
-            client_api = TradingEconomicsAPI(api_key, timeout, rate_limit, logger)
-            data_map = client_api.fetch_all(country, INDICATOR_MAP, indicator_keys)
-        else:
-            scraper = TradingEconomicsScraper(country, INDICATOR_MAP, timeout, rate_limit, logger, base_dir)
-            data_map = scraper.fetch_all(indicator_keys)
-        # Process each indicator for this country
         for key in indicator_keys:
-            info = INDICATOR_MAP.get(key)
-            if not info:
-                logger.warning("No mapping found for indicator %s", key)
-                continue
-            cache_key = f"{country}:{key}"
-            cached = cache.get(cache_key)
+            cached = cache.get(
+                f"{country}:{key}", ttl_override=INDICATOR_MAP.get(key, {}).get("ttl_minutes")
+            )
             if cached:
-                values = cached
+                cached_values.setdefault(country, {})[key] = cached
+            else:
+                missing.setdefault(country, []).append(key)
+    to_fetch = [country for country in countries if country in missing]
+    lookups = cache.hits + cache.misses
+    if lookups:
+        logger.info(
+            "Value cache: %d/%d hits (%.0f%%)", cache.hits, lookups, 100.0 * cache.hits / lookups
+        )
+
+    # Resolve the indicator mappings once rather than once per country
+    active: List[Tuple[str, Dict[str, Any]]] = []
+    for key in indicator_keys:
+        info = INDICATOR_MAP.get(key)
+        if info:
+            active.append((key, info))
+        else:
+            logger.warning("No mapping found for indicator %s", key)
+
+    def build_rows(country: str, data_map: Dict) -> List[MacroRow]:
+        """Validate, cache and shape one country's values into table rows."""
+        country_rows: List[MacroRow] = []
+        resolved = []
+        # Pick cached or freshly fetched values for each indicator
+        for key, info in active:
+            values = cached_values.get(country, {}).get(key)
+            if values:
                 logger.debug("Using cached values for %s (%s)", key, country)
             else:
-                # Default structure ensures keys exist
-                values = data_map.get(key) or {
-                    "current": None,
-                    "previous": None,
-                    "expected": None,
-                    "published": None,
-                    "next_release": None,
-                    "trend": None,
-                }
-                cache.set(cache_key, values)
-            current = validate(key, values.get("current"))
-            previous = validate(key, values.get("previous"))
-            expected = validate(key, values.get("expected"))
+                values = data_map.get(key)
+                # Only cache successful fetches so failures are retried next run
+                if values and any(values.get(f) is not None for f in ("current", "previous", "expected")):
+                    cache.set(f"{country}:{key}", values)
+                else:
+                    # Default structure ensures keys exist
+                    values = values or {
+                        "current": None,
+                        "previous": None,
+                        "expected": None,
+                        "published": None,
+                        "next_release": None,
+                        "trend": None,
+                    }
+            resolved.append((key, info, values))
+        # Range-check every indicator of the country in one batch
+        validated = validate_many(
+            [key for key, _, _ in resolved],
+            [(v.get("current"), v.get("previous"), v.get("expected")) for _, _, v in resolved],
+        )
+        for (key, info, values), (current, previous, expected) in zip(resolved, validated):
             published = values.get("published")
             next_release = values.get("next_release")
             trend = values.get("trend")  # list or None
-            diff = compute_difference(current, previous)
-            surprise = compute_difference(current, expected) if expected is not None else None
-            if current is not None:
-                successes += 1
-            row_dict = {
-                "Country": country,
-                "Indicator": info["name"],
-                "Current": current,
-                "Previous": previous,
-                "Difference": diff,
-                "Expected Future": expected,
-                "Surprise": surprise,
-                "Published": published,
-                "Next Release": next_release,
-            }
-            # Include trend if available
-            if trend is not None:
-                row_dict["Trend"] = trend
-            rows.append(row_dict)
+            diff, surprise = compute_differences(current, previous, expected)
+            country_rows.append(
+                MacroRow(
+                    country=country,
+                    indicator=info["name"],
+                    current=current,
+                    previous=previous,
+                    difference=diff,
+                    expected=expected,
+                    surprise=surprise,
+                    published=published,
+                    next_release=next_release,
+                    trend=trend,
+                )
+            )
+        return country_rows
+
+    total = len(countries) * len(indicator_keys)
+    done = 0
+
+    def country_done() -> None:
+        """Report progress after one country's rows have been built."""
+        nonlocal done
+        done += len(indicator_keys)
+        if progress_cb is not None:
+            progress_cb(done, total)
+
+    def check_cancelled() -> None:
+        if cancel_event is not None and cancel_event.is_set():
+            logger.info("Run cancelled by user.")
+            raise CancelledError()
+
+    rows_by_country: Dict[str, List[MacroRow]] = {}
+    fetched: Dict[str, Dict] = {}
+    cookie_jar = None
+    if to_fetch:
+        session = _get_session(max(max_connections, max_concurrency * page_concurrency))
+        cookie_jar = session.cookies
+    if to_fetch and source == "api":
+        from .sources.te_api import TradingEconomicsAPI
+
+        # The API accepts several countries per request, so batch them
+        client_api = TradingEconomicsAPI(
+            api_key, timeout, rate_limit, logger, session=session, http_cache=http_cache
+        )
+        # Over HTTP/2 the API uses its own client instead of ``session``
+        cookie_jar = client_api.cookies
+    if cookie_jar is not None and not cookie_jar:
+        # First run in this process: pick up the previous process's cookies
+        http_cache.load_cookies(cookie_jar)
+    if to_fetch and source == "api":
+        fetched = client_api.fetch_many(
+            to_fetch, INDICATOR_MAP, indicator_keys, max_workers=max(1, max_concurrency)
+        )
+    elif to_fetch:
+        # Scrape countries concurrently and post-process each one as soon as
+        # it completes, so validation and caching overlap with the countries
+        # still waiting on the network.
+        pool = _get_executor(max(1, max_concurrency))
+        futures = {
+            pool.submit(
+                scrape_country,
+                country,
+                missing[country],
+                timeout,
+                rate_limit,
+                logger,
+                base_dir,
+                session,
+                http_cache,
+                cancel_event,
+                page_concurrency,
+            ): country
+            for country in to_fetch
+        }
+        pending = set(futures)
+        try:
+            # Poll with a short timeout so a cancel request is noticed even
+            # while every remaining country is still waiting on the network
+            while pending:
+                check_cancelled()
+                finished, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    country = futures[future]
+                    rows_by_country[country] = build_rows(country, future.result())
+                    country_done()
+        except CancelledError:
+            # Drop queued scrapes; running ones stop at their next indicator
+            for future in futures:
+                future.cancel()
+            # Keep the values of the countries that did complete
+            cache.flush()
+            raise
+    check_cancelled()
+    if cookie_jar is not None:
+        http_cache.save_cookies(cookie_jar)
+    for country in countries:
+        if country not in rows_by_country:
+            rows_by_country[country] = build_rows(country, fetched.get(country, {}))
+            country_done()
+
+    cache.flush()
+
+    # Assemble rows in configured country order
+    rows = [row for country in countries for row in rows_by_country[country]]
+    successes = sum(1 for row in rows if row.current is not None)
+
     # Print and save table
-    print_and_save(rows, base_dir, source)
+    print_and_save(
+        rows,
+        base_dir,
+        source,
+        save_json="json" in output_formats,
+        save_csv="csv" in output_formats,
+        save_parquet="parquet" in output_formats,
+    )
     # Determine exit code: success if at least 75% of indicator-country combos have current values
     total_needed = len(countries) * len(indicator_keys)
     return 0 if successes >= max(1, int(0.75 * total_needed)) else 1
@@ -0,0 +1,30 @@
+"""Record types shared by the scraper front-ends.
+
+Rows are plain slotted dataclasses rather than dictionaries: each one is a
+fixed set of fields, so slots keep them compact and make attribute access a
+descriptor lookup instead of a string hash.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass(slots=True)
+class MacroRow:
+    """One indicator for one country, as shown in the result tables.
+
+    Field order matches the table/CSV column order, ``trend`` last.
+    """
+
+    country: str
+    indicator: str
+    current: Optional[float] = None
+    previous: Optional[float] = None
+    difference: Optional[float] = None
+    expected: Optional[float] = None
+    surprise: Optional[float] = None
+    published: Optional[str] = None
+    next_release: Optional[str] = None
+    trend: Optional[List[float]] = None
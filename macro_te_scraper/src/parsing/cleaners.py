@@ -3,7 +3,15 @@
 from __future__ import annotations
 
 import re
-from typing import Optional
+from typing import Optional, Tuple
+
+# First signed decimal number in a cleaned string
+_NUM_RE = re.compile(r"[-+]?[0-9]*\.?[0-9]+")
+# Single-character clean-up done in one translate pass: drop percent signs,
+# thousands separators and spaces; map en/em dashes to a minus sign
+_TRANS = str.maketrans({"%": None, ",": None, " ": None, "–": "-", "—": "-"})
+# Unit words
+_WORD_RE = re.compile(r"points?")
 
 
 def parse_value(raw: str) -> Optional[float]:
@@ -25,15 +33,20 @@ def parse_value(raw: str) -> Optional[float]:
     """
     if raw is None:
         return None
-    s = raw.strip().lower()
-    # Remove percent signs and unit words
-    s = s.replace("%", "").replace("points", "").replace("point", "")
-    # Remove commas and spaces
-    s = s.replace(",", "").replace(" ", "")
-    # Replace double negative or weird dashes
-    s = s.replace("–", "-").replace("—", "-")
+    s = raw.strip().lower().translate(_TRANS)
+    # Fast path: a plain signed decimal (the common case once "%" and
+    # separators are gone) goes straight to float().  The digit check keeps
+    # inputs like "nan", "inf" or "1e3" on the regex path, which reads them
+    # the way it always has.
+    if s.lstrip("+-").replace(".", "", 1).isdigit():
+        try:
+            return float(s)
+        except ValueError:
+            pass
+    # Remove unit words
+    s = _WORD_RE.sub("", s)
     # Extract number using regex (match first occurrence of optional sign, digits, decimal)
-    match = re.search(r"[-+]?[0-9]*\.?[0-9]+", s)
+    match = _NUM_RE.search(s)
     if not match:
         return None
     try:
@@ -53,3 +66,20 @@ def compute_difference(current: Optional[float], previous: Optional[float]) -> O
     diff = current - previous
     # Round to two decimals for consistency
     return round(diff, 2)
+
+
+def compute_differences(
+    current: Optional[float], previous: Optional[float], expected: Optional[float]
+) -> Tuple[Optional[float], Optional[float]]:
+    """Return ``(difference, surprise)`` for one indicator in a single call.
+
+    ``difference`` is current minus previous and ``surprise`` is current
+    minus expected, each rounded to two decimals, or None when either
+    operand is missing.  Same results as two :func:`compute_difference`
+    calls without the second call's overhead.
+    """
+    if current is None:
+        return None, None
+    diff = None if previous is None else round(current - previous, 2)
+    surprise = None if expected is None else round(current - expected, 2)
+    return diff, surprise
@@ -8,7 +8,7 @@ Values falling outside this range are treated as invalid and replaced with
 
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 
 # Lower and upper bounds for each indicator.  These ranges were chosen
@@ -47,8 +47,31 @@ def validate(indicator: str, value: Optional[float]) -> Optional[float]:
     """
     if value is None:
         return None
-    bounds: Tuple[float, float] = INDICATOR_RANGES.get(indicator, (-float("inf"), float("inf")))
+    bounds = INDICATOR_RANGES.get(indicator)
+    if bounds is None:
+        # No range defined for this indicator: nothing to check against
+        return value
     lo, hi = bounds
     if lo <= value <= hi:
         return value
     return None
+
+
+def validate_many(
+    indicators: Sequence[str], rows: Iterable[Sequence[Optional[float]]]
+) -> List[Tuple[Optional[float], ...]]:
+    """Validate a batch of value tuples, one tuple per indicator.
+
+    ``rows[i]`` holds the values for ``indicators[i]``.  Each indicator's
+    bounds are looked up once for its whole tuple; indicators without a
+    range are passed through as-is.
+    """
+    results: List[Tuple[Optional[float], ...]] = []
+    for indicator, values in zip(indicators, rows):
+        bounds = INDICATOR_RANGES.get(indicator)
+        if bounds is None:
+            results.append(tuple(values))
+            continue
+        lo, hi = bounds
+        results.append(tuple(v if v is not None and lo <= v <= hi else None for v in values))
+    return results
@@ -12,51 +12,222 @@ depending on the exact API responses.
 
 from __future__ import annotations
 
+import http.cookiejar
+import json
+import re
+import threading
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 
 import requests
 
+from ..utils.backoff import MAX_RETRY_DELAY, jittered
+from ..utils.cache import HttpCache, HttpCacheEntry
+
+# orjson parses response bodies several times faster than the stdlib decoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# httpx (with the h2 extra) speaks HTTP/2, so concurrent batch requests are
+# multiplexed over one TLS connection instead of one connection each
+try:
+    import h2  # noqa: F401  (required by httpx for http2=True)
+    import httpx
+except ImportError:
+    httpx = None
+
+
+# Maximum number of countries joined into a single ``/country/`` request
+BATCH_SIZE = 20
+
+# Plain decimal/scientific number, as the API returns in string fields
+_FLOAT_RE = re.compile(r"\s*[-+]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?\s*")
+
+
+def _safe_float(value) -> Optional[float]:
+    """Coerce an API field to float, or None, without raising.
+
+    Most fields are already numbers or null, so those are handled by type
+    checks; only strings that look numeric reach ``float()``.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str) and _FLOAT_RE.fullmatch(value):
+        return float(value)
+    return None
+
+
+_http2_client = None
+_http2_lock = threading.Lock()
+
+
+def _get_http2_client(timeout: int):
+    """Return the process-wide HTTP/2 client, creating it on first use."""
+    global _http2_client
+    with _http2_lock:
+        if _http2_client is None:
+            _http2_client = httpx.Client(
+                http2=True,
+                timeout=timeout,
+                limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+            )
+        return _http2_client
+
 
 class TradingEconomicsAPI:
     BASE_URL = "https://api.tradingeconomics.com"
 
-    def __init__(self, api_key: str, timeout: int, rate_limit: float, logger) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        timeout: int,
+        rate_limit: float,
+        logger,
+        session: Optional[requests.Session] = None,
+        http2: bool = True,
+        http_cache: Optional[HttpCache] = None,
+    ) -> None:
         self.api_key = api_key
         self.timeout = timeout
         self.rate_limit = rate_limit
         self.logger = logger
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/119.0 Safari/537.36",
-                "Accept": "application/json",
-            }
-        )
+        self.http_cache = http_cache
+        # Endpoints with a background revalidation in flight, so a burst of
+        # stale hits triggers a single refresh per endpoint
+        self._refreshing: Set[str] = set()
+        self._refreshing_lock = threading.Lock()
+        # Category -> keys maps built by _category_keys, per requested key
+        # tuple, for the indicator map they were built from
+        self._category_map_source: Optional[Dict[str, Dict[str, str]]] = None
+        self._category_maps: Dict[Tuple[str, ...], Dict[str, List[str]]] = {}
+        # The HTTP/2 client is shared by every instance; without httpx the
+        # given (pooled) requests session is used as before
+        if http2 and httpx is not None:
+            self.session = _get_http2_client(timeout)
+        else:
+            self.session = session if session is not None else requests.Session()
+        # Sent with every request rather than set on the client, which may be
+        # shared with other instances or with the page scraper
+        self.headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/119.0 Safari/537.36",
+            "Accept": "application/json",
+        }
+
+    @property
+    def cookies(self) -> http.cookiejar.CookieJar:
+        """Cookie jar of the client the requests actually go through."""
+        cookies = self.session.cookies
+        if httpx is not None and isinstance(cookies, httpx.Cookies):
+            return cookies.jar
+        return cookies
+
+    @staticmethod
+    def _loads(body: str) -> List[Dict]:
+        return orjson.loads(body) if orjson is not None else json.loads(body)
 
     def _request(self, endpoint: str) -> Optional[List[Dict]]:
-        url = f"{self.BASE_URL}{endpoint}"
+        """GET ``endpoint`` and decode the JSON body, using the HTTP cache.
+
+        Entries within the cache TTL are returned without a request.  Entries
+        within the stale window are returned immediately while a background
+        thread revalidates them.  Anything older is revalidated inline with
+        ``If-None-Match``/``If-Modified-Since``; a 304 reuses the stored body.
+        The API key is appended here so it never ends up in the cache.
+        A cached body that does not decode is dropped and fetched again.
+        """
+        cache_key = f"{self.BASE_URL}{endpoint}"
+        cached = self.http_cache.get(cache_key) if self.http_cache else None
+        if cached and (self.http_cache.is_fresh(cached) or self.http_cache.is_servable_stale(cached)):
+            data = self._decode_cached(cache_key, cached)
+            if data is None:
+                cached = None
+            else:
+                if not self.http_cache.is_fresh(cached):
+                    self._revalidate_in_background(endpoint, cached)
+                return data
+        return self._get(endpoint, cached)
+
+    def _decode_cached(self, cache_key: str, cached: HttpCacheEntry) -> Optional[List[Dict]]:
+        """Decode a cached body, discarding the entry if it is not valid JSON."""
+        try:
+            return self._loads(cached.body)
+        except ValueError:
+            self.logger.warning("Dropping undecodable cached response for %s", cache_key)
+            self.http_cache.discard(cache_key)
+            return None
+
+    def _revalidate_in_background(self, endpoint: str, cached: HttpCacheEntry) -> None:
+        with self._refreshing_lock:
+            if endpoint in self._refreshing:
+                return
+            self._refreshing.add(endpoint)
+
+        def _refresh() -> None:
+            try:
+                self._get(endpoint, cached)
+            finally:
+                with self._refreshing_lock:
+                    self._refreshing.discard(endpoint)
+
+        threading.Thread(target=_refresh, name="te-api-revalidate", daemon=True).start()
+
+    def _get(self, endpoint: str, cached: Optional[HttpCacheEntry]) -> Optional[List[Dict]]:
+        """Fetch and decode ``endpoint`` with retries, updating the HTTP cache.
+
+        A 200 body is only cached once it has decoded; one that does not
+        (e.g. an HTML error page or a truncated body) is retried like a
+        server error.
+        """
+        cache_key = f"{self.BASE_URL}{endpoint}"
+        sep = "&" if "?" in endpoint else "?"
+        url = f"{cache_key}{sep}c={self.api_key}"
+        conditional = cached.conditional_headers() if cached else {}
         delay = self.rate_limit
         for attempt in range(5):
             try:
-                resp = self.session.get(url, timeout=self.timeout)
+                resp = self.session.get(url, headers={**self.headers, **conditional}, timeout=self.timeout)
+                if resp.status_code == 304 and cached:
+                    data = self._decode_cached(cache_key, cached)
+                    if data is None:
+                        # Stored body unusable: ask for a full response
+                        cached, conditional = None, {}
+                        continue
+                    self.http_cache.touch(cache_key, cached)
+                    time.sleep(self.rate_limit)
+                    return data
                 if resp.status_code == 200:
+                    body = resp.text
+                    # Raises ValueError on a non-JSON body, which is retried
+                    # below and never reaches the cache
+                    data = self._loads(body)
+                    if self.http_cache:
+                        self.http_cache.set(
+                            cache_key,
+                            body,
+                            resp.headers.get("ETag"),
+                            resp.headers.get("Last-Modified"),
+                        )
                     time.sleep(self.rate_limit)
-                    return resp.json()
+                    return data
                 if resp.status_code in (429, 500, 502, 503, 504):
                     self.logger.warning(
-                        "API HTTP %s for %s, retrying", resp.status_code, url
+                        "API HTTP %s for %s, retrying", resp.status_code, cache_key
                     )
-                    time.sleep(delay)
-                    delay *= 2
+                    time.sleep(jittered(delay))
+                    delay = min(delay * 2, MAX_RETRY_DELAY)
                     continue
-                self.logger.error("API request %s failed with status %s", url, resp.status_code)
+                self.logger.error("API request %s failed with status %s", cache_key, resp.status_code)
                 return None
             except Exception as e:
-                self.logger.warning("API request error for %s: %s", url, str(e))
-                time.sleep(delay)
-                delay *= 2
+                self.logger.warning("API request error for %s: %s", cache_key, str(e))
+                time.sleep(jittered(delay))
+                delay = min(delay * 2, MAX_RETRY_DELAY)
         return None
 
     def fetch_all(self, country: str, indicator_map: Dict[str, Dict[str, str]], indicator_keys: List[str]) -> Dict[str, Dict[str, Optional[float]]]:
@@ -65,49 +236,126 @@ class TradingEconomicsAPI:
         Returns a dict mapping indicator keys to a dict with current, previous and expected values.
         The expected field comes from the API's `teforecast` field if available.
         """
-        result: Dict[str, Dict[str, Optional[float]]] = {}
-        # Fetch all indicator data for the country
-        endpoint = f"/country/{country}?c={self.api_key}"
+        return self.fetch_many([country], indicator_map, indicator_keys).get(country, {})
+
+    def fetch_many(
+        self,
+        countries: List[str],
+        indicator_map: Dict[str, Dict[str, str]],
+        indicator_keys: List[str],
+        batch_size: int = BATCH_SIZE,
+        max_workers: int = 4,
+    ) -> Dict[str, Dict[str, Dict[str, Optional[float]]]]:
+        """Fetch indicators for several countries with as few requests as possible.
+
+        The ``/country/`` endpoint accepts a comma separated list of
+        countries, so countries are grouped into chunks of ``batch_size`` and
+        each chunk is fetched with a single request.  When there is more than
+        one chunk, up to ``max_workers`` of those requests run concurrently.
+        The combined response is split back into per-country results using
+        each item's ``country`` field.
+
+        Returns a dict mapping country slug to the same structure returned by
+        :meth:`fetch_all`.
+        """
+        category_keys = self._category_keys(indicator_map, indicator_keys)
+        chunks = [countries[start : start + batch_size] for start in range(0, len(countries), batch_size)]
+        if len(chunks) <= 1 or max_workers <= 1:
+            chunk_results = [self._fetch_chunk(chunk, category_keys) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+                chunk_results = list(pool.map(lambda chunk: self._fetch_chunk(chunk, category_keys), chunks))
+        results: Dict[str, Dict[str, Dict[str, Optional[float]]]] = {}
+        for chunk_result in chunk_results:
+            results.update(chunk_result)
+        return results
+
+    def _category_keys(
+        self, indicator_map: Dict[str, Dict[str, str]], indicator_keys: List[str]
+    ) -> Dict[str, List[str]]:
+        """Map each lower-cased API category to the requested keys it feeds.
+
+        Row labels are normalised here, once, so matching API items only
+        lower-cases the item's own category.  The result is reused by later
+        calls with the same indicator map and keys (e.g. one
+        :meth:`fetch_all` per country).
+        """
+        if indicator_map is not self._category_map_source:
+            self._category_map_source = indicator_map
+            self._category_maps = {}
+        memo_key = tuple(indicator_keys)
+        category_keys = self._category_maps.get(memo_key)
+        if category_keys is None:
+            category_keys = {}
+            for key in indicator_keys:
+                info = indicator_map.get(key)
+                if info:
+                    category_keys.setdefault(info.get("row_label", "").lower(), []).append(key)
+            self._category_maps[memo_key] = category_keys
+        return category_keys
+
+    def _fetch_chunk(
+        self,
+        chunk: List[str],
+        category_keys: Dict[str, List[str]],
+    ) -> Dict[str, Dict[str, Dict[str, Optional[float]]]]:
+        """Fetch one ``/country/`` request and split it per country."""
+        endpoint = f"/country/{','.join(chunk)}"
         data = self._request(endpoint)
+        if not data:
+            return {country: {} for country in chunk}
+        grouped: Dict[str, List[Dict]] = {country: [] for country in chunk}
+        if len(chunk) == 1:
+            # Single-country request: every item belongs to that country
+            grouped[chunk[0]] = data
+        else:
+            for item in data:
+                name = item.get("country") or item.get("Country") or ""
+                slug = str(name).strip().lower().replace(" ", "-")
+                if slug in grouped:
+                    grouped[slug].append(item)
+        results: Dict[str, Dict[str, Dict[str, Optional[float]]]] = {}
+        for country in chunk:
+            if not grouped[country]:
+                self.logger.warning("API returned no data for %s", country)
+            results[country] = self._map_indicators(grouped[country], category_keys)
+        return results
+
+    def _map_indicators(
+        self,
+        data: List[Dict],
+        category_keys: Dict[str, List[str]],
+    ) -> Dict[str, Dict[str, Optional[float]]]:
+        """Map raw API items for one country onto the requested indicator keys.
+
+        Each item is expected to have 'category', 'latestValue',
+        'previousValue' and 'teforecast' keys; items whose category was not
+        requested are skipped without converting their values.
+        """
+        result: Dict[str, Dict[str, Optional[float]]] = {}
         if not data:
             return result
-        # Build a mapping from category names to values
-        # Each item in data is expected to have keys: 'category', 'latestValue', 'previousValue', 'teforecast'
-        lookup: Dict[str, Dict[str, Optional[float]]] = {}
         for item in data:
             category = item.get("category")
             if not category:
                 continue
-            latest_value = item.get("latestValue")
-            previous_value = item.get("previousValue")
-            forecast = item.get("teforecast") or item.get("forecast")
-            try:
-                latest_value = float(latest_value) if latest_value is not None else None
-            except Exception:
-                latest_value = None
-            try:
-                previous_value = float(previous_value) if previous_value is not None else None
-            except Exception:
-                previous_value = None
-            try:
-                forecast = float(forecast) if forecast is not None else None
-            except Exception:
-                forecast = None
-            lookup[category.lower()] = {
-                "current": latest_value,
-                "previous": previous_value,
-                "expected": forecast,
-            }
-        # Map requested indicators
-        for key in indicator_keys:
-            info = indicator_map.get(key)
-            if not info:
+            keys = category_keys.get(category.lower())
+            if not keys:
                 continue
-            category = info.get("row_label", "").lower()
-            res = lookup.get(category)
-            if res:
-                result[key] = res
+            values = {
+                "current": _safe_float(item.get("latestValue")),
+                "previous": _safe_float(item.get("previousValue")),
+                "expected": _safe_float(item.get("teforecast") or item.get("forecast")),
+            }
+            if len(keys) == 1:
+                result[keys[0]] = values
             else:
-                self.logger.error("API data for %s not found", category)
-                result[key] = {"current": None, "previous": None, "expected": None}
+                for key in keys:
+                    result[key] = dict(values)
+        # Requested indicators the API did not return
+        for category, keys in category_keys.items():
+            for key in keys:
+                if key not in result:
+                    self.logger.error("API data for %s not found", category)
+                    result[key] = {"current": None, "previous": None, "expected": None}
         return result
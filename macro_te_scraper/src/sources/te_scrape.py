@@ -11,30 +11,166 @@ interface.
 from __future__ import annotations
 
 import re
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
 
 from ..parsing.cleaners import parse_value
+from ..utils.backoff import MAX_RETRY_DELAY, jittered
+from ..utils.cache import HttpCache, HttpCacheEntry
+
+# Parser backend handed to BeautifulSoup for every page: libxml2-based lxml
+# parses several times faster than the pure-Python html.parser, which is
+# kept as the fallback when lxml is not installed
+try:
+    import lxml  # noqa: F401
+
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+# The indicators page is only searched for table rows (see `_find_row`), so
+# only <table> subtrees are turned into soup objects; navigation, scripts and
+# the rest of the page are skipped while parsing
+_TABLES_ONLY = SoupStrainer("table")
+
+# "… is expected to be 4.5 …" sentence on indicator pages
+_EXPECTED_RE = re.compile(r"is\s+expected\s+to\s+be\s+([-+]?[0-9]*\.?[0-9]+)", re.IGNORECASE)
+
+# Reference period in the last cell of an indicators-page row: "Dec/25" or
+# "Dec2025" (spaces already removed).  Months are looked up in a fixed
+# English table rather than with strptime's %b, which follows the process
+# locale; only the first three letters count, so "Sept" and "December" work.
+_REF_RE = re.compile(r"([A-Za-z]+)(?:/(\d{2})|(\d{4}))")
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), start=1
+    )
+}
+
+
+def _parse_reference(ref_clean: str) -> Optional[str]:
+    """Return the first day of a reference period as ``YYYY-MM-DD``, or None."""
+    m = _REF_RE.match(ref_clean)
+    if m is None:
+        return None
+    month = _MONTHS.get(m.group(1)[:3].title())
+    if month is None:
+        return None
+    if m.group(2) is not None:
+        year_suffix = int(m.group(2))
+        year = 2000 + year_suffix if year_suffix < 70 else 1900 + year_suffix
+    else:
+        year = int(m.group(3))
+    return f"{year:04d}-{month:02d}-01"
+
+
+def _row_cells(tr) -> Tuple[str, ...]:
+    """Return the stripped texts of a table row's own ``<td>``/``<th>`` cells.
+
+    Only direct children are visited, which avoids ``find_all``'s recursive
+    walk and intermediate result list.
+    """
+    return tuple(c.get_text(strip=True) for c in tr.children if getattr(c, "name", None) in ("td", "th"))
+
+
+# Links into a country's pages on its indicators page, as (href, anchor)
+# pairs in document order (see `_anchor_index`)
+AnchorIndex = List[Tuple[str, Tag]]
+
+
+def _anchor_index(soup: BeautifulSoup, country: str) -> AnchorIndex:
+    """Collect the links into ``/{country}/`` on an indicators page.
+
+    Built with a single selector pass, so resolving K indicator rows scans
+    this short list K times instead of walking the whole page K times.
+    Every link an href-substring search for ``/{country}/<slug>`` can match
+    is in the list, in document order, so scanning it for the first match
+    finds the same anchor as searching the page.
+    """
+    return [(a.get("href", ""), a) for a in soup.select(f'a[href*="/{country}/"]')]
+
+
+# In-process memo of page bodies shared by every scraper instance, mapping
+# url -> (monotonic fetch time, body) in fetch order.  Entries expire after
+# _MEMO_TTL_SECONDS and are purged as new pages arrive, and the memo never
+# holds more than _MEMO_MAX_CHARS of page text, so a long-running GUI keeps
+# roughly one refresh worth of pages.  Concurrent requests for the same URL
+# wait on a single in-flight fetch instead of hitting the network twice
+# (e.g. on impatient repeat clicks).
+_MEMO_TTL_SECONDS = 300
+_MEMO_MAX_CHARS = 32 * 1024 * 1024
+_MEMO: Dict[str, Tuple[float, str]] = {}
+_memo_chars = 0
+_INFLIGHT: Dict[str, "Future[Optional[str]]"] = {}
+_MEMO_LOCK = threading.Lock()
+
+
+def _memo_put(url: str, body: str) -> None:
+    """Store ``body`` in the memo and purge expired or excess entries.
+
+    The caller must hold ``_MEMO_LOCK``.
+    """
+    global _memo_chars
+    now = time.monotonic()
+    previous = _MEMO.pop(url, None)
+    if previous is not None:
+        _memo_chars -= len(previous[1])
+    _MEMO[url] = (now, body)
+    _memo_chars += len(body)
+    # Entries are in fetch order, so expired ones and the oldest ones to
+    # drop for the size cap are all at the front
+    while _MEMO:
+        oldest_url, (fetched_at, oldest_body) = next(iter(_MEMO.items()))
+        if now - fetched_at < _MEMO_TTL_SECONDS and _memo_chars <= _MEMO_MAX_CHARS:
+            break
+        del _MEMO[oldest_url]
+        _memo_chars -= len(oldest_body)
 
 
 class TradingEconomicsScraper:
-    """Scraper for Trading Economics indicators."""
+    """Scraper for Trading Economics indicators.
+
+    An instance is bound to ``country_slug`` by default, but every public
+    fetch method also accepts an explicit ``country`` so a single instance
+    (and its session, cache and headers) can serve many countries, including
+    from several threads at once.
+    """
 
     BASE_URL = "https://tradingeconomics.com"
 
+    # Cap on requests in flight to BASE_URL across every instance and
+    # thread, so nested country/page concurrency cannot flood the host
+    MAX_CONCURRENT_REQUESTS = 32
+    _host_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+    # Earliest monotonic time the next request may be sent.  ``rate_limit``
+    # is a minimum interval between requests to the host shared by every
+    # instance and thread, so concurrency overlaps latency without raising
+    # the request rate.
+    _next_send_at = 0.0
+    _send_lock = threading.Lock()
+
     def __init__(
         self,
-        country_slug: str,
+        country_slug: Optional[str],
         indicator_map: Dict[str, Dict[str, str]],
         timeout: int,
         rate_limit: float,
         logger,
         base_dir: Path,
+        session: Optional[requests.Session] = None,
+        http_cache: Optional[HttpCache] = None,
+        max_workers: int = 4,
+        max_age: Optional[float] = None,
+        force_fresh: bool = False,
     ) -> None:
         self.country = country_slug
         self.indicator_map = indicator_map
@@ -42,7 +178,28 @@ class TradingEconomicsScraper:
         self.rate_limit = rate_limit
         self.logger = logger
         self.base_dir = base_dir
-        self.session = requests.Session()
+        # Number of indicator detail pages fetched concurrently by fetch_all
+        self.max_workers = max(1, int(max_workers))
+        # Callers may pass a shared session so the connection pool (and the
+        # TCP/TLS handshakes it saves) outlives this scraper instance.
+        if session is None:
+            session = requests.Session()
+            # Every request goes to one host: a single pool, large enough
+            # that concurrent page fetches never open throwaway connections.
+            # Retries are handled by _fetch, so the adapter does none.
+            session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=1, pool_maxsize=max(16, self.max_workers), max_retries=0),
+            )
+        self.session = session
+        # Optional store of page bodies used for conditional GETs
+        self.http_cache = http_cache
+        # Seconds a cached page may be served without revalidation; None
+        # uses the HTTP cache's own TTL
+        self.max_age = max_age
+        # Ignore every cached copy (memo and disk) and fetch from the
+        # network; fresh responses are still stored for later runs
+        self.force_fresh = force_fresh
         # Browser‑like headers
         self.session.headers.update(
             {
@@ -53,29 +210,99 @@ class TradingEconomicsScraper:
         )
 
     def _request(self, url: str) -> Optional[str]:
+        """Fetch a URL, reusing recent or in-flight fetches of the same URL.
+
+        Memoised bodies are only reused while younger than ``max_age`` (when
+        set) as well as the memo's own TTL.
+
+        Returns the text content on success or ``None`` on failure.
+        """
+        if self.force_fresh:
+            return self._fetch(url)
+        memo_ttl = _MEMO_TTL_SECONDS if self.max_age is None else min(_MEMO_TTL_SECONDS, self.max_age)
+        with _MEMO_LOCK:
+            entry = _MEMO.get(url)
+            if entry is not None and time.monotonic() - entry[0] < memo_ttl:
+                return entry[1]
+            future = _INFLIGHT.get(url)
+            owner = future is None
+            if owner:
+                future = Future()
+                _INFLIGHT[url] = future
+        if not owner:
+            return future.result()
+        body = None
+        try:
+            body = self._fetch(url)
+        finally:
+            with _MEMO_LOCK:
+                del _INFLIGHT[url]
+                if body is not None:
+                    _memo_put(url, body)
+            future.set_result(body)
+        return body
+
+    def _wait_for_send_slot(self) -> None:
+        """Block until the shared per-host rate limit allows another request."""
+        cls = type(self)
+        with cls._send_lock:
+            now = time.monotonic()
+            send_at = max(now, cls._next_send_at)
+            cls._next_send_at = send_at + self.rate_limit
+        if send_at > now:
+            time.sleep(send_at - now)
+
+    def _fetch(self, url: str) -> Optional[str]:
         """Fetch a URL with retries and rate limiting.
 
+        When an HTTP cache is configured, a page younger than the cache's TTL
+        (or ``max_age``, if set) is returned without any network access.  Older pages are requested
+        conditionally on the stored ``ETag``/``Last-Modified`` validators, and
+        a ``304`` answer returns the cached body without transferring it
+        again.  If every attempt fails, a stale cached body is returned
+        instead of ``None`` (stale-if-error).
+
         Returns the text content on success or ``None`` on failure.
         """
         last_exception = None
         delay = self.rate_limit
+        cached = self.http_cache.get(url) if self.http_cache and not self.force_fresh else None
+        if cached and self._is_fresh(cached):
+            self.logger.debug("%s served from HTTP cache", url)
+            return cached.body
+        headers = cached.conditional_headers() if cached else None
         for attempt in range(5):
             try:
-                resp = self.session.get(url, timeout=self.timeout)
+                with self._host_slots:
+                    self._wait_for_send_slot()
+                    resp = self.session.get(url, timeout=self.timeout, headers=headers)
                 status = resp.status_code
+                if status == 304 and cached:
+                    self.logger.debug("%s not modified; using cached body", url)
+                    self.http_cache.touch(url, cached)
+                    return cached.body
                 if status == 200:
-                    time.sleep(self.rate_limit)
-                    return resp.text
+                    # Decode with the declared charset rather than through
+                    # resp.text, which runs charset detection over the whole
+                    # body when the server does not declare one; the pages
+                    # are UTF-8
+                    body = resp.content.decode(resp.encoding or "utf-8", errors="replace")
+                    if self.http_cache:
+                        self.http_cache.set(
+                            url, body, resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+                        )
+                    return body
                 if status in (429, 500, 502, 503, 504):
+                    wait = jittered(delay)
                     self.logger.warning(
                         "Received HTTP %s for %s (attempt %d), retrying after %.1fs",
                         status,
                         url,
                         attempt + 1,
-                        delay,
+                        wait,
                     )
-                    time.sleep(delay)
-                    delay *= 2
+                    time.sleep(wait)
+                    delay = min(delay * 2, MAX_RETRY_DELAY)
                     continue
                 else:
                     self.logger.error("HTTP %s for %s", status, url)
@@ -85,50 +312,71 @@ class TradingEconomicsScraper:
                 self.logger.warning(
                     "Error fetching %s on attempt %d: %s", url, attempt + 1, str(e)
                 )
-                time.sleep(delay)
-                delay *= 2
+                time.sleep(jittered(delay))
+                delay = min(delay * 2, MAX_RETRY_DELAY)
         if last_exception:
             self.logger.error("Failed to fetch %s: %s", url, str(last_exception))
+        if cached:
+            self.logger.warning("Serving stale cached copy of %s", url)
+            return cached.body
         return None
 
-    def fetch_indicators_page(self) -> Optional[BeautifulSoup]:
+    def _is_fresh(self, cached: HttpCacheEntry) -> bool:
+        """Return True if ``cached`` may be served without revalidation."""
+        if self.max_age is not None:
+            return cached.is_fresh(self.max_age)
+        return self.http_cache.is_fresh(cached)
+
+    def fetch_indicators_page(self, country: Optional[str] = None) -> Optional[BeautifulSoup]:
         """Retrieve and parse the country's indicators page."""
-        url = f"{self.BASE_URL}/{self.country}/indicators"
+        country = country or self.country
+        url = f"{self.BASE_URL}/{country}/indicators"
         html = self._request(url)
         if html is None:
             self._save_debug("indicators_page", url, "failed to fetch indicators page", html)
             return None
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_TABLES_ONLY)
         return soup
 
-    def _find_row(self, soup: BeautifulSoup, slug: str, row_label: str) -> Optional[List[str]]:
+    def _find_row(
+        self,
+        soup: BeautifulSoup,
+        slug: str,
+        row_label: str,
+        country: Optional[str] = None,
+        anchors: Optional[AnchorIndex] = None,
+    ) -> Optional[Tuple[str, ...]]:
         """Locate the table row for an indicator.
 
         The function first tries to find an anchor whose href contains the slug.
         If not found, it falls back to searching for a link with matching text
-        (row_label).
+        (row_label).  With an ``anchors`` index of the page, the slug search
+        scans the index instead of the page.
 
-        Returns a list of cell texts if found, else None.
+        Returns a tuple of cell texts if found, else None.
         """
-        # 1. Try by slug
+        # 1. Try by slug.  The attribute-contains selector is matched by
+        # soupsieve without calling back into Python for every <a> tag.
+        href_part = f"/{country or self.country}/{slug}"
         try:
-            anchor = soup.find(
-                "a", href=lambda h: isinstance(h, str) and f"/{self.country}/{slug}" in h
-            )
+            if anchors is not None:
+                anchor = next((a for href, a in anchors if href_part in href), None)
+            else:
+                anchor = soup.select_one(f'a[href*="{href_part}"]')
             if anchor:
                 tr = anchor.find_parent("tr")
                 if tr:
-                    cells = [td.get_text(strip=True) for td in tr.find_all(["td", "th"])]
+                    cells = _row_cells(tr)
                     return cells
         except Exception:
             pass
-        # 2. Fallback by row_label
+        # 2. Fallback by row_label (case-insensitive substring of the link text)
         try:
-            anchor = soup.find("a", string=lambda t: isinstance(t, str) and row_label.lower() in t.lower())
+            anchor = soup.find("a", string=re.compile(re.escape(row_label), re.IGNORECASE))
             if anchor:
                 tr = anchor.find_parent("tr")
                 if tr:
-                    cells = [td.get_text(strip=True) for td in tr.find_all(["td", "th"])]
+                    cells = _row_cells(tr)
                     return cells
         except Exception:
             pass
@@ -160,17 +408,26 @@ class TradingEconomicsScraper:
             self.logger.error("Failed to fetch expected value page %s", url)
             self._save_debug(expected_url.replace("/", "_"), url, "failed expected page", html)
             return None, None, None
-        soup = BeautifulSoup(html, "html.parser")
-        text = soup.get_text(separator=" ", strip=True)
+        # One parse serves both the calendar table and the page text
+        soup = BeautifulSoup(html, _HTML_PARSER)
         expected: Optional[float] = None
-        next_release: Optional[str] = None
-        trend: Optional[List[float]] = None
-        # 1. Look for phrase "is expected to be X"
-        m = re.search(
-            r"is\s+expected\s+to\s+be\s+([-+]?[0-9]*\.?[0-9]+)",
-            text,
-            re.IGNORECASE,
-        )
+        # The calendar table gives the next release date and the trend, and
+        # the expected value when the page has no "is expected to be" phrase.
+        # It typically contains rows like: Date GMT Reference Actual Previous
+        # Consensus TEForecast.
+        cal_expected, next_release, trend = self._parse_calendar(soup)
+        # 1. Look for phrase "is expected to be X".  Usually it sits inside a
+        # single text node, so only that node's block is flattened; the whole
+        # page text is only built when markup splits the phrase.  Script,
+        # style and comment strings (NavigableString subclasses) are left to
+        # the full-page scan, whose get_text() skips them.
+        m = None
+        node = soup.find(string=_EXPECTED_RE)
+        if node is not None and type(node) is NavigableString:
+            m = _EXPECTED_RE.search(node.parent.get_text(separator=" ", strip=True))
+        if m is None:
+            text = soup.get_text(separator=" ", strip=True)
+            m = _EXPECTED_RE.search(text)
         if m:
             raw_number = m.group(1)
             try:
@@ -178,24 +435,8 @@ class TradingEconomicsScraper:
             except Exception:
                 expected = None
         else:
-            # Fallback: parse consensus or TEForecast from the calendar section
-            # The calendar table typically contains rows like: Date GMT Reference Actual Previous Consensus TEForecast
-            # We'll extract the first row (most recent or next release) for expected values.
-            # Parse the table from HTML.
-            cal_expected, cal_next, cal_trend = self._parse_calendar(soup)
-            if cal_expected is not None:
-                expected = cal_expected
-            if cal_next:
-                next_release = cal_next
-            if cal_trend:
-                trend = cal_trend
-        # Even if primary expected was found, still attempt to extract trend and next release from calendar
-        if trend is None or next_release is None:
-            _, nr, tr = self._parse_calendar(soup)
-            if next_release is None:
-                next_release = nr
-            if trend is None:
-                trend = tr
+            # Fallback: consensus or TEForecast from the calendar section
+            expected = cal_expected
         return expected, next_release, trend
 
     def _parse_calendar(
@@ -220,43 +461,39 @@ class TradingEconomicsScraper:
             rows = table.find_all("tr")
             # Skip header row; gather up to 6 actual values
             for tr in rows[1:]:
-                cells = [td.get_text(strip=True) for td in tr.find_all(["td", "th"])]
+                cells = _row_cells(tr)
                 if not cells:
                     continue
                 # cells structure: [Date, GMT, Reference, Actual, Previous, Consensus, TEForecast]
+                if len(cells) < 4:
+                    continue
+                # Parse the actual value once; it drives both checks below
+                try:
+                    actual = parse_value(cells[3])
+                    parse_failed = False
+                except Exception:
+                    actual = None
+                    parse_failed = True
                 # 1. Collect trend from actual column if numeric
                 # Use first 6 numeric actuals
-                if len(trend) < 6:
-                    if len(cells) >= 4:
-                        actual_str = cells[3]
-                        try:
-                            val = parse_value(actual_str)
-                            if val is not None:
-                                trend.append(val)
-                        except Exception:
-                            pass
-                # 2. Determine if this row is the next release: actual cell missing or contains non‑numeric
-                if next_release is None:
-                    if len(cells) >= 4:
-                        actual_str = cells[3]
-                        try:
-                            _ = parse_value(actual_str)
-                            # numeric actual: already released; skip for next release
-                        except Exception:
-                            # Not numeric -> this is upcoming release row
-                            # Next release date is in first cell
-                            next_release = cells[0]
-                            # Consensus or forecast for expected value
-                            consensus = cells[5] if len(cells) > 5 else ""
-                            teforecast = cells[6] if len(cells) > 6 else ""
-                            try:
-                                if teforecast:
-                                    expected = parse_value(teforecast)
-                                elif consensus:
-                                    expected = parse_value(consensus)
-                            except Exception:
-                                pass
-                # Break early if we collected 6 trends and found next_release
+                if actual is not None and len(trend) < 6:
+                    trend.append(actual)
+                # 2. Determine if this row is the next release: only an
+                # actual cell that fails to parse marks the upcoming release
+                if parse_failed and next_release is None:
+                    # Next release date is in first cell
+                    next_release = cells[0]
+                    # Consensus or forecast for expected value
+                    consensus = cells[5] if len(cells) > 5 else ""
+                    teforecast = cells[6] if len(cells) > 6 else ""
+                    try:
+                        if teforecast:
+                            expected = parse_value(teforecast)
+                        elif consensus:
+                            expected = parse_value(consensus)
+                    except Exception:
+                        pass
+                # Stop as soon as the trend is full and the next release is known
                 if len(trend) >= 6 and next_release is not None:
                     break
             # Ensure trend list has up to 6 values
@@ -267,13 +504,71 @@ class TradingEconomicsScraper:
             self.logger.debug("Error parsing calendar table: %s", e)
         return None, None, None
 
-    def fetch_all(self, indicator_keys: List[str]) -> Dict[str, Dict[str, Optional[float]]]:
+    def _parse_row(
+        self,
+        soup: BeautifulSoup,
+        key: str,
+        info: Dict[str, str],
+        country: str,
+        anchors: Optional[AnchorIndex] = None,
+    ) -> Dict[str, Optional[float]]:
+        """Parse one indicator's row on the country's indicators page."""
+        slug: str | None = info.get("slug")
+        row_label: str | None = info.get("row_label")
+        current = previous = expected = None
+        published: Optional[str] = None
+        next_release: Optional[str] = None
+        # Parse current and previous from the country indicators page
+        try:
+            cells = self._find_row(soup, slug, row_label, country, anchors)
+            if cells and len(cells) >= 3:
+                # cells[1] -> last/current, cells[2] -> previous
+                current = parse_value(cells[1])
+                previous = parse_value(cells[2])
+                # Attempt to extract reference date (published date) from last cell
+                if len(cells) >= 5:
+                    ref = cells[-1]
+                    # Parse month/year reference like "Dec/25" or "Dec 2025"
+                    ref_clean = ref.replace(" ", "").replace("\xa0", "")
+                    published = _parse_reference(ref_clean)
+                self.logger.debug("%s row cells: %s", key, cells)
+            else:
+                self.logger.error("Row for %s not found or malformed", key)
+        except Exception as e:
+            self.logger.error("Error parsing row for %s: %s", key, e)
+        # Values may be None if missing; expected value, next release and
+        # trend are filled in from the detail pages by the caller
+        return {
+            "current": current,
+            "previous": previous,
+            "expected": expected,
+            "published": published,
+            "next_release": next_release,
+            "trend": None,
+        }
+
+    def fetch_all(
+        self,
+        indicator_keys: List[str],
+        cancel_event: Optional[threading.Event] = None,
+        country: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Optional[float]]]:
         """Fetch current, previous and expected values for all requested indicators.
 
         Parameters
         ----------
         indicator_keys : list of str
             Keys corresponding to entries in ``self.indicator_map``.
+        cancel_event : threading.Event, optional
+            When set, remaining indicators are skipped and the partial
+            results collected so far are returned.
+        country : str, optional
+            Country slug to scrape; defaults to the one given at construction.
+
+        Current and previous values come from the country's indicators page;
+        the per-indicator detail pages (expected value, next release, trend)
+        are fetched concurrently on up to ``self.max_workers`` threads,
+        starting while the indicators page itself is still downloading.
 
         Returns
         -------
@@ -282,84 +577,61 @@ class TradingEconomicsScraper:
             and ``expected`` (floats or None).
         """
         results: Dict[str, Dict[str, Optional[float]]] = {}
-        soup = self.fetch_indicators_page()
-        if soup is None:
-            # If page fetch fails, return empty results
-            return results
+        country = country or self.country
+        # Detail page URLs only depend on the country and slug, so those
+        # fetches start straight away and overlap with the indicators page
+        detail_pages: List[Tuple[str, str]] = []
         for key in indicator_keys:
-            # Look up indicator definition.  Skip if missing.
             info = self.indicator_map.get(key)
-            if not info:
-                self.logger.warning("Indicator %s not found in mapping", key)
-                continue
-            slug: str | None = info.get("slug")
-            row_label: str | None = info.get("row_label")
-            # Build expected URL dynamically: combine country and slug
-            expected_url: Optional[str] = None
-            if slug:
-                expected_url = f"{self.country}/{slug}"
-            current = previous = expected = None
-            published: Optional[str] = None
-            next_release: Optional[str] = None
-            # Parse current and previous from the country indicators page
-            try:
-                cells = self._find_row(soup, slug, row_label)
-                if cells and len(cells) >= 3:
-                    # cells[1] -> last/current, cells[2] -> previous
-                    current = parse_value(cells[1])
-                    previous = parse_value(cells[2])
-                    # Attempt to extract reference date (published date) from last cell
-                    if len(cells) >= 5:
-                        ref = cells[-1]
-                        # Parse month/year reference like "Dec/25" or "Dec 2025"
-                        ref_clean = ref.replace(" ", "").replace("\xa0", "")
-                        try:
-                            # Match format like Dec/25
-                            mref = re.match(r"([A-Za-z]+)/(\d{2})", ref_clean)
-                            if mref:
-                                mon = mref.group(1)[:3].title()
-                                year_suffix = int(mref.group(2))
-                                year = 2000 + year_suffix if year_suffix < 70 else 1900 + year_suffix
-                                month = ["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"].index(mon) + 1
-                                published = f"{year:04d}-{month:02d}-01"
-                            else:
-                                # Match format like Dec2025 or Dec2025
-                                mref2 = re.match(r"([A-Za-z]+)(\d{4})", ref_clean)
-                                if mref2:
-                                    mon = mref2.group(1)[:3].title()
-                                    year = int(mref2.group(2))
-                                    month = ["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"].index(mon) + 1
-                                    published = f"{year:04d}-{month:02d}-01"
-                        except Exception:
-                            pass
-                    self.logger.debug("%s row cells: %s", key, cells)
-                else:
-                    self.logger.error("Row for %s not found or malformed", key)
-            except Exception as e:
-                self.logger.error("Error parsing row for %s: %s", key, e)
-            # Fetch expected value, next release, and trend by visiting the indicator's dedicated page
-            trend_values: Optional[List[float]] = None
-            if expected_url:
+            if info and info.get("slug"):
+                detail_pages.append((key, f"{country}/{info['slug']}"))
+        workers = max(1, min(self.max_workers, len(detail_pages)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="te-pages") as pool:
+            # Fetch expected value, next release, and trend by visiting each
+            # indicator's dedicated page, several at a time
+            futures = {
+                pool.submit(self.fetch_expected_and_trend, expected_url): key
+                for key, expected_url in detail_pages
+            }
+            soup = self.fetch_indicators_page(country)
+            if soup is None:
+                # If page fetch fails, return empty results
+                for pending in futures:
+                    pending.cancel()
+                return results
+            anchors = _anchor_index(soup, country)
+            for key in indicator_keys:
+                if cancel_event is not None and cancel_event.is_set():
+                    self.logger.info("Scrape of %s cancelled", country)
+                    break
+                # Look up indicator definition.  Skip if missing.
+                info = self.indicator_map.get(key)
+                if not info:
+                    self.logger.warning("Indicator %s not found in mapping", key)
+                    continue
+                results[key] = self._parse_row(soup, key, info, country, anchors)
+            for future in as_completed(futures):
+                if cancel_event is not None and cancel_event.is_set():
+                    self.logger.info("Scrape of %s cancelled", country)
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                key = futures[future]
                 try:
-                    expected_value, next_rel, trend_values = self.fetch_expected_and_trend(
-                        expected_url
-                    )
-                    if expected_value is not None:
-                        expected = expected_value
-                    # Override next_release if found on page
-                    if next_rel:
-                        next_release = next_rel
+                    expected_value, next_rel, trend_values = future.result()
                 except Exception as e:
                     self.logger.error("Error parsing expected/trend for %s: %s", key, e)
-            # Store results (values may be None if missing)
-            results[key] = {
-                "current": current,
-                "previous": previous,
-                "expected": expected,
-                "published": published,
-                "next_release": next_release,
-                "trend": trend_values,
-            }
+                    continue
+                entry = results.get(key)
+                if entry is None:
+                    # The row loop was cancelled before this indicator
+                    continue
+                if expected_value is not None:
+                    entry["expected"] = expected_value
+                # Override next_release if found on page
+                if next_rel:
+                    entry["next_release"] = next_rel
+                entry["trend"] = trend_values
         return results
 
     def _save_debug(self, name: str, url: str, reason: str, html: Optional[str]) -> None:
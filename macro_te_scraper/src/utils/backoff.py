@@ -0,0 +1,19 @@
+"""Retry back-off shared by the scraper and the API client.
+
+Waits double after every failed attempt, capped at :data:`MAX_RETRY_DELAY`
+so the last retries stay bounded.  Each wait is also jittered: scrapers
+that were throttled by the same 429 would otherwise all retry at the same
+instant and be throttled again together.
+"""
+
+from __future__ import annotations
+
+import random
+
+# Upper bound, in seconds, for the un-jittered retry delay
+MAX_RETRY_DELAY = 30.0
+
+
+def jittered(delay: float) -> float:
+    """Return ``delay`` scaled by a random factor between 0.5 and 1.5."""
+    return delay * random.uniform(0.5, 1.5)
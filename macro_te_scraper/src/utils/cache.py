@@ -5,71 +5,307 @@ the scraped values along with the UTC timestamp when they were cached.  If
 retrieved within the configured TTL, cached values are returned instead of
 scraping again.  The cache is persisted to JSON on disk in the `output/`
 directory.
+
+:class:`HttpCache` complements it at the HTTP layer: it keeps the raw body
+of each fetched page together with its ``ETag``/``Last-Modified``
+validators.  Pages younger than its TTL are served straight from disk;
+expired pages are revalidated with a conditional GET, where a
+``304 Not Modified`` answer costs a round-trip but no body transfer.  An
+optional stale window past the TTL lets callers serve the stored copy
+immediately and revalidate it in the background.
 """
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import http.cookiejar
 import json
+import os
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+# orjson reads and writes the cache file several times faster than the
+# stdlib json module, and works on bytes directly
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 @dataclass
 class CacheEntry:
     data: Dict[str, Any]
-    timestamp: datetime
+    # When the entry was cached, in microseconds since the Unix epoch (UTC)
+    ts: int
+
+
+def _now_us() -> int:
+    return time.time_ns() // 1000
+
+
+def _iso_to_us(ts_str: str) -> int:
+    """Convert a naive-UTC ISO timestamp (the old cache format) to epoch µs."""
+    ts = datetime.fromisoformat(ts_str).replace(tzinfo=timezone.utc)
+    return int(ts.timestamp() * 1_000_000)
 
 
 class Cache:
-    """File‑based cache with a time‑to‑live for each entry."""
+    """File‑based cache with a time‑to‑live for each entry.
+
+    ``hits`` and ``misses`` count :meth:`get` outcomes so callers can report
+    how effective the TTLs are.
+
+    :meth:`set` only updates memory; call :meth:`flush` (typically once at
+    the end of a run) to write the changes to disk.
+
+    Timestamps are kept as integer epoch microseconds, in memory and on
+    disk, so loading, saving and TTL checks need no datetime conversions.
+    Files written with the older ISO ``timestamp`` field are still read.
+    """
 
     def __init__(self, cache_file: Path, ttl_minutes: int) -> None:
         self.cache_file = cache_file
-        self.ttl = timedelta(minutes=ttl_minutes)
+        self._ttl_us = int(ttl_minutes * 60_000_000)
         self._entries: Dict[str, CacheEntry] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
         self._load()
 
     def _load(self) -> None:
         if not self.cache_file.exists():
             return
         try:
-            with self.cache_file.open("r", encoding="utf-8") as f:
-                raw = json.load(f)
+            content = self.cache_file.read_bytes()
+            raw = orjson.loads(content) if orjson is not None else json.loads(content)
             for key, val in raw.items():
-                ts_str = val.get("timestamp")
                 data = val.get("data")
-                if ts_str and data:
+                if not data:
+                    continue
+                ts = val.get("ts")
+                if ts is None:
+                    ts_str = val.get("timestamp")
+                    if not ts_str:
+                        continue
                     try:
-                        ts = datetime.fromisoformat(ts_str)
-                        self._entries[key] = CacheEntry(data=data, timestamp=ts)
+                        ts = _iso_to_us(ts_str)
                     except Exception:
                         continue
+                self._entries[key] = CacheEntry(data=data, ts=ts)
         except Exception:
             # Corrupt cache; ignore
             self._entries = {}
 
-    def get(self, key: str) -> Optional[Dict[str, Any]]:
+    def get(self, key: str, ttl_override: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Return the cached value for ``key`` if it is still within its TTL.
+
+        ``ttl_override`` (minutes) replaces the cache-wide TTL for this lookup.
+        """
         entry = self._entries.get(key)
-        if not entry:
-            return None
-        if datetime.utcnow() - entry.timestamp < self.ttl:
+        ttl_us = self._ttl_us if ttl_override is None else ttl_override * 60_000_000
+        if entry and _now_us() - entry.ts < ttl_us:
+            self.hits += 1
             return entry.data
+        self.misses += 1
         return None
 
     def set(self, key: str, value: Dict[str, Any]) -> None:
-        self._entries[key] = CacheEntry(data=value, timestamp=datetime.utcnow())
-        self.save()
+        self._entries[key] = CacheEntry(data=value, ts=_now_us())
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Persist the cache if anything changed since the last save."""
+        if self._dirty:
+            self.save()
 
     def save(self) -> None:
         # Persist all entries to JSON
-        serialisable: Dict[str, Any] = {}
-        for key, entry in self._entries.items():
-            serialisable[key] = {
-                "data": entry.data,
-                "timestamp": entry.timestamp.isoformat(),
-            }
+        serialisable: Dict[str, Any] = {
+            key: {"data": entry.data, "ts": entry.ts} for key, entry in self._entries.items()
+        }
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-        with self.cache_file.open("w", encoding="utf-8") as f:
-            json.dump(serialisable, f, indent=2)
+        # Write a sibling file and swap it in, so a crash mid-write never
+        # leaves a truncated cache behind
+        tmp = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        if orjson is not None:
+            tmp.write_bytes(orjson.dumps(serialisable, option=orjson.OPT_INDENT_2))
+        else:
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(serialisable, f, indent=2)
+        os.replace(tmp, self.cache_file)
+        self._dirty = False
+
+
+@dataclass
+class HttpCacheEntry:
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: datetime
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Return the request headers needed to revalidate this entry."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def is_fresh(self, ttl_seconds: float) -> bool:
+        """Return True if the entry is younger than ``ttl_seconds``."""
+        return datetime.utcnow() - self.fetched_at < timedelta(seconds=ttl_seconds)
+
+
+class HttpCache:
+    """Content-addressed on-disk store of HTTP response bodies.
+
+    Each URL maps to ``<sha256(url)>.body.gz`` holding the gzipped response
+    text and a ``<sha256(url)>.json`` sidecar with the URL, validators and
+    fetch time.  HTML compresses 5-10x, and level 1 keeps the CPU cost
+    negligible next to parsing; uncompressed ``.body`` files written by
+    older versions are still read.
+    One file pair per URL keeps concurrent scrapers from contending on a
+    shared index file.
+
+    ``ttl_seconds`` is how long a stored page may be used without contacting
+    the server at all (0 disables this and always revalidates).
+    ``stale_seconds`` extends that by a window in which the page may still
+    be served while a refresh runs in the background (0 disables it).
+    """
+
+    def __init__(self, cache_dir: Path, ttl_seconds: float = 0, stale_seconds: float = 0) -> None:
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+
+    # zlib level for stored bodies: fastest setting, most of the size gain
+    COMPRESS_LEVEL = 1
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.body.gz", self.cache_dir / f"{digest}.json"
+
+    def get(self, url: str) -> Optional[HttpCacheEntry]:
+        body_path, meta_path = self._paths(url)
+        try:
+            with meta_path.open("r", encoding="utf-8") as f:
+                meta = json.load(f)
+            try:
+                body = gzip.decompress(body_path.read_bytes()).decode("utf-8")
+            except FileNotFoundError:
+                # Entry written before bodies were compressed
+                body = body_path.with_suffix("").read_text(encoding="utf-8")
+            return HttpCacheEntry(
+                body=body,
+                etag=meta.get("etag"),
+                last_modified=meta.get("last_modified"),
+                fetched_at=datetime.fromisoformat(meta["fetched_at"]),
+            )
+        except Exception:
+            # Missing or corrupt entry; treat as a miss
+            return None
+
+    def is_fresh(self, entry: HttpCacheEntry) -> bool:
+        """Return True if ``entry`` can be used without revalidation."""
+        return self.ttl_seconds > 0 and entry.is_fresh(self.ttl_seconds)
+
+    def is_servable_stale(self, entry: HttpCacheEntry) -> bool:
+        """Return True if ``entry`` is past its TTL but within the stale window."""
+        return self.stale_seconds > 0 and entry.is_fresh(self.ttl_seconds + self.stale_seconds)
+
+    def set(self, url: str, body: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        body_path, _ = self._paths(url)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Body first so a reader never sees metadata without its body
+        body_path.write_bytes(gzip.compress(body.encode("utf-8"), compresslevel=self.COMPRESS_LEVEL))
+        # Drop an uncompressed copy left by an older version
+        body_path.with_suffix("").unlink(missing_ok=True)
+        self._write_meta(url, etag, last_modified)
+
+    def touch(self, url: str, entry: HttpCacheEntry) -> None:
+        """Restart the TTL of an entry the server confirmed is unchanged."""
+        self._write_meta(url, entry.etag, entry.last_modified)
+
+    def discard(self, url: str) -> None:
+        """Remove the stored entry for ``url``, e.g. after its body proved unusable."""
+        body_path, meta_path = self._paths(url)
+        # Metadata first so a reader never sees it without its body
+        for path in (meta_path, body_path, body_path.with_suffix("")):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def load_cookies(self, jar) -> None:
+        """Restore cookies saved by :meth:`save_cookies` into ``jar``.
+
+        ``jar`` is any ``http.cookiejar.CookieJar``, e.g. a requests
+        session's cookies or the ``.jar`` of an httpx client's cookies.
+        Lets a fresh process resume the previous run's server session
+        (consent/clearance cookies) instead of negotiating a new one.
+        Expired cookies are dropped.
+        """
+        try:
+            with (self.cache_dir / "cookies.json").open("r", encoding="utf-8") as f:
+                cookies = json.load(f)
+        except Exception:
+            return
+        now = time.time()
+        for cookie in cookies:
+            expires = cookie.get("expires")
+            if expires is not None and expires <= now:
+                continue
+            domain = cookie.get("domain", "")
+            jar.set_cookie(
+                http.cookiejar.Cookie(
+                    version=0,
+                    name=cookie["name"],
+                    value=cookie["value"],
+                    port=None,
+                    port_specified=False,
+                    domain=domain,
+                    domain_specified=bool(domain),
+                    domain_initial_dot=domain.startswith("."),
+                    path=cookie.get("path", "/"),
+                    path_specified=True,
+                    secure=cookie.get("secure", False),
+                    expires=expires,
+                    discard=expires is None,
+                    comment=None,
+                    comment_url=None,
+                    rest={},
+                )
+            )
+
+    def save_cookies(self, jar) -> None:
+        """Persist the cookies of ``jar`` (a ``http.cookiejar.CookieJar``)."""
+        cookies = [
+            {
+                "name": c.name,
+                "value": c.value,
+                "domain": c.domain,
+                "path": c.path,
+                "expires": c.expires,
+                "secure": c.secure,
+            }
+            for c in jar
+        ]
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with (self.cache_dir / "cookies.json").open("w", encoding="utf-8") as f:
+            json.dump(cookies, f)
+
+    def _write_meta(self, url: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        _, meta_path = self._paths(url)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": datetime.utcnow().isoformat(),
+        }
+        with meta_path.open("w", encoding="utf-8") as f:
+            json.dump(meta, f)
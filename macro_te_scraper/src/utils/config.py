@@ -0,0 +1,82 @@
+"""Configuration loading shared by the CLI, the Tk GUI and MacroScanner.
+
+`config.yaml` is the file users edit, but it rarely changes between runs.
+The first load after an edit parses the YAML and writes a compiled
+``config.json`` next to it; later loads read that JSON instead, which is
+several times faster than even libyaml's C loader.  The JSON copy records
+the modification time and size of the YAML it was compiled from and is only
+trusted while both still match exactly, so any change to the YAML -- an
+edit, or an older copy restored with its original timestamp -- wins.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+from pathlib import Path
+from typing import Dict, Tuple
+
+# orjson parses bytes directly and is faster still than the stdlib decoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _read_compiled(json_path: Path, stamp: Tuple[int, int]):
+    """Return the compiled config, or None if it is missing or outdated.
+
+    ``stamp`` is the YAML file's ``(st_mtime_ns, st_size)``; the compiled
+    copy is only used if it was built from a file with exactly that stamp.
+    """
+    try:
+        raw = json_path.read_bytes()
+        compiled = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if compiled.get("source") != list(stamp):
+            return None
+        return compiled["config"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        return None
+
+
+def _write_compiled(json_path: Path, config: Dict, stamp: Tuple[int, int]) -> None:
+    """Best-effort write of the compiled config next to the YAML file."""
+    compiled = {"source": list(stamp), "config": config}
+    try:
+        if orjson is not None:
+            json_path.write_bytes(orjson.dumps(compiled))
+        else:
+            json_path.write_text(json.dumps(compiled), encoding="utf-8")
+    except (OSError, TypeError):
+        # Read-only install or a value JSON cannot represent: keep using YAML
+        pass
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_config(config_path: Path, stamp: Tuple[int, int]) -> Dict:
+    """Parse the config; memoised per path and (modification time, size)."""
+    json_path = config_path.with_suffix(".json")
+    config = _read_compiled(json_path, stamp)
+    if config is None:
+        # PyYAML is only imported when the compiled copy cannot be used
+        import yaml
+
+        # libyaml's C loader parses roughly ten times faster; fall back to
+        # the pure-Python safe loader when PyYAML was built without it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with config_path.open("r", encoding="utf-8") as f:
+            config = yaml.load(f, Loader=loader)
+        _write_compiled(json_path, config, stamp)
+    return config
+
+
+def load_config(config_path: Path) -> Dict:
+    """Load the YAML configuration file.
+
+    The parsed result is cached, so repeated loads in one process (e.g. GUI
+    clicks) only pay for a ``stat``.  Editing the file invalidates the cache
+    through its modification time and size.  Callers must treat the returned
+    dict as read-only.
+    """
+    st = config_path.stat()
+    return _parse_config(config_path, (st.st_mtime_ns, st.st_size))
@@ -8,11 +8,29 @@ use the returned logger throughout your code.
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import queue
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+# Listener thread writing each configured logger's queued records, by name
+_LISTENERS: Dict[str, QueueListener] = {}
+_LISTENERS_LOCK = threading.Lock()
+
+
+def _stop_listeners() -> None:
+    """Drain every listener's queue and close its handlers at exit."""
+    with _LISTENERS_LOCK:
+        for listener in _LISTENERS.values():
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        _LISTENERS.clear()
 
 
 def setup_logger(base_dir: Path, name: str = "macro_scraper") -> logging.Logger:
@@ -30,7 +48,16 @@ def setup_logger(base_dir: Path, name: str = "macro_scraper") -> logging.Logger:
     -------
     logging.Logger
         Configured logger instance.
+
+    The file and console handlers run on a background listener thread, so
+    logging calls only enqueue the record and never wait on disk I/O.
+    Calling it again for the same ``name`` (e.g. on every GUI run) starts a
+    new log file for that run: records still queued for the previous file
+    are written to it first, and the logger keeps its single queue handler
+    instead of stacking more handlers.
     """
+    logger = logging.getLogger(name)
+
     # Ensure logs directory exists
     logs_dir = base_dir / "logs"
     logs_dir.mkdir(parents=True, exist_ok=True)
@@ -38,7 +65,6 @@ def setup_logger(base_dir: Path, name: str = "macro_scraper") -> logging.Logger:
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     log_file = logs_dir / f"run_{timestamp}.log"
 
-    logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
 
     # File handler
@@ -49,14 +75,31 @@ def setup_logger(base_dir: Path, name: str = "macro_scraper") -> logging.Logger:
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     fh.setFormatter(file_format)
-    logger.addHandler(fh)
 
     # Console handler
     ch = logging.StreamHandler()
     ch.setLevel(logging.INFO)
     console_format = logging.Formatter("%(message)s")
     ch.setFormatter(console_format)
-    logger.addHandler(ch)
+
+    with _LISTENERS_LOCK:
+        previous = _LISTENERS.get(name)
+        if previous is not None:
+            # New run in this process: finish the previous run's file, then
+            # switch the same queue over to this run's handlers
+            previous.stop()
+            for handler in previous.handlers:
+                handler.close()
+            log_queue = previous.queue
+        else:
+            if not _LISTENERS:
+                # Drain queued records and close the log files on exit
+                atexit.register(_stop_listeners)
+            log_queue = queue.SimpleQueue()
+            logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, fh, ch, respect_handler_level=True)
+        listener.start()
+        _LISTENERS[name] = listener
 
     logger.debug("Logger initialised. Log file: %s", log_file)
     return logger
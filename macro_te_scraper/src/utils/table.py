@@ -3,10 +3,57 @@
 from __future__ import annotations
 
 import csv
+import io
 import json
+import os
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
+
+from ..models import MacroRow
+
+# Parquet output is optional and only available when pyarrow is installed
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+PARQUET_AVAILABLE = pa is not None
+
+# orjson serialises several times faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Output column names and the MacroRow attributes they come from, in order
+_COLUMNS = (
+    ("Country", "country"),
+    ("Indicator", "indicator"),
+    ("Current", "current"),
+    ("Previous", "previous"),
+    ("Difference", "difference"),
+    ("Expected Future", "expected"),
+    ("Surprise", "surprise"),
+    ("Published", "published"),
+    ("Next Release", "next_release"),
+)
+
+
+def _row_dict(row: MacroRow) -> Dict[str, Any]:
+    """Return ``row`` keyed by output column name, as written to JSON.
+
+    ``Trend`` is only included when the row has one.
+    """
+    data = {column: getattr(row, attr) for column, attr in _COLUMNS}
+    if row.trend is not None:
+        data["Trend"] = row.trend
+    return data
+
 
 def _compute_widths(rows: List[List[str]], headers: List[str]) -> List[int]:
     """Compute the maximum width for each column.
@@ -23,26 +70,26 @@ def _compute_widths(rows: List[List[str]], headers: List[str]) -> List[int]:
     list of int
         Width of each column.
     """
-    widths = [len(h) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            widths[i] = max(widths[i], len(cell))
-    return widths
+    if not rows:
+        return [len(h) for h in headers]
+    # One pass per column over the transposed rows; max() runs in C
+    return [max(len(h), *map(len, column)) for h, column in zip(headers, zip(*rows))]
 
 
 def print_and_save(
-    rows: List[Dict[str, Optional[float]]],
+    rows: List[MacroRow],
     base_dir: Path,
     source: str,
     save_json: bool = True,
+    save_csv: bool = True,
+    save_parquet: bool = False,
 ) -> None:
     """Print the results table to stdout and save CSV/JSON files.
 
     Parameters
     ----------
-    rows : list of dict
-        Each dict must contain the keys: Indicator, Current, Previous,
-        Difference, Expected Future.
+    rows : list of MacroRow
+        Result rows in display order.
     base_dir : Path
         Root directory of the project.  Files will be saved under
         ``output/`` relative to this directory.
@@ -50,115 +97,125 @@ def print_and_save(
         Either ``"api"`` or ``"scrape"`` to record in the output file.
     save_json : bool, optional
         Whether to save a JSON file alongside the CSV.  Defaults to True.
+    save_csv : bool, optional
+        Whether to save the CSV file.  Defaults to True.
+    save_parquet : bool, optional
+        Whether to save a zstd-compressed Parquet file.  Requires pyarrow and
+        is silently skipped when it is not installed.  Defaults to False.
     """
     if not rows:
         print("No data to display.")
         return
-    # Determine which extra fields are present
-    base_fields = ["Indicator", "Current", "Previous", "Difference", "Expected Future"]
-    extra_fields = []
-    for field in ["Surprise", "Published", "Next Release"]:
-        if field in rows[0]:
-            extra_fields.append(field)
+    headers = [column for column, _ in _COLUMNS]
     # Prepare printable rows
-    printable_rows: List[List[str]] = []
-    for row in rows:
-        row_values: List[str] = []
-        # Indicator, current, previous, difference, expected
-        row_values.append(row.get("Indicator", ""))
-        row_values.append(_format_number(row.get("Current")))
-        row_values.append(_format_number(row.get("Previous")))
-        row_values.append(_format_number(row.get("Difference")))
-        row_values.append(_format_number(row.get("Expected Future")))
-        # Extra fields
-        for field in extra_fields:
-            value = row.get(field)
-            # Format numbers for Surprise
-            if field == "Surprise":
-                row_values.append(_format_number(value))
-            else:
-                row_values.append(str(value) if value is not None else "")
-        printable_rows.append(row_values)
-    # Determine headers
-    if "Country" in rows[0]:
-        headers = ["Country"] + base_fields + extra_fields
-        # Prepend country values to printable rows
-        printable_rows = [
-            [r.get("Country", "")] + row for r, row in zip(rows, printable_rows)
+    printable_rows: List[List[str]] = [
+        [
+            row.country,
+            row.indicator,
+            _format_number(row.current),
+            _format_number(row.previous),
+            _format_number(row.difference),
+            _format_number(row.expected),
+            _format_number(row.surprise),
+            row.published if row.published is not None else "",
+            row.next_release if row.next_release is not None else "",
         ]
-    else:
-        headers = base_fields + extra_fields
+        for row in rows
+    ]
     widths = _compute_widths(printable_rows, headers)
 
-    # Print header
-    header_line = " ".join(
-        h.ljust(widths[i]) if i == 0 else h.rjust(widths[i]) for i, h in enumerate(headers)
+    # One format string for every line: first column left aligned, the
+    # rest right aligned
+    line_fmt = " ".join(
+        f"{{:<{w}}}" if i == 0 else f"{{:>{w}}}" for i, w in enumerate(widths)
     )
-    print(header_line)
-    # Underline
-    print(" ".join("-" * w for w in widths))
-    # Print rows
-    for row in printable_rows:
-        # Build each line with left alignment for the first column and right alignment for the rest
-        line_parts: List[str] = []
-        for i in range(len(headers)):
-            cell = row[i]
-            if i == 0:
-                line_parts.append(cell.ljust(widths[i]))
-            else:
-                line_parts.append(cell.rjust(widths[i]))
-        print(" ".join(line_parts))
-
-    # Save CSV
+    # Header, underline and rows go to stdout in a single write
+    lines = [line_fmt.format(*headers), " ".join("-" * w for w in widths)]
+    lines.extend(line_fmt.format(*row) for row in printable_rows)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    # Save output files
     output_dir = base_dir / "output"
     output_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-    csv_path = output_dir / "latest_macro.csv"
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        # Determine CSV headers including extra fields
-        extra_fields = []
-        for field in ["Surprise", "Published", "Next Release"]:
-            if field in rows[0]:
-                extra_fields.append(field)
-        if "Country" in rows[0]:
-            csv_headers = [
-                "Country",
-                "Indicator",
-                "Current",
-                "Previous",
-                "Difference",
-                "Expected Future",
-            ] + extra_fields + ["TimestampUTC", "Source"]
-        else:
-            csv_headers = [
-                "Indicator",
-                "Current",
-                "Previous",
-                "Difference",
-                "Expected Future",
-            ] + extra_fields + ["TimestampUTC", "Source"]
-        writer.writerow(csv_headers)
-        for row in rows:
-            row_list = []
-            if "Country" in row:
-                row_list.append(row.get("Country", ""))
-            row_list.extend([
-                row.get("Indicator", ""),
-                row.get("Current", ""),
-                row.get("Previous", ""),
-                row.get("Difference", ""),
-                row.get("Expected Future", ""),
-            ])
-            # Add extra fields values
-            for field in extra_fields:
-                row_list.append(row.get(field, ""))
-            row_list.extend([timestamp, source])
-            writer.writerow(row_list)
+    if save_csv:
+        _write_csv(rows, output_dir / "latest_macro.csv", timestamp, source)
     if save_json:
-        json_path = output_dir / "latest_macro.json"
-        with json_path.open("w", encoding="utf-8") as f:
-            json.dump({"timestamp": timestamp, "source": source, "data": rows}, f, indent=2)
+        _write_json(
+            {"timestamp": timestamp, "source": source, "data": [_row_dict(row) for row in rows]},
+            output_dir / "latest_macro.json",
+        )
+    if save_parquet and PARQUET_AVAILABLE:
+        _write_parquet(rows, output_dir / "latest_macro.parquet", timestamp, source)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` in one call and atomically swap it in.
+
+    The bytes go to a sibling temporary file which then replaces ``path``,
+    so readers never observe a partially written output file.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _write_csv(rows: List[MacroRow], csv_path: Path, timestamp: str, source: str) -> None:
+    """Write the result rows to ``csv_path``."""
+    attrs = [attr for _, attr in _COLUMNS]
+    with io.StringIO(newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([column for column, _ in _COLUMNS] + ["TimestampUTC", "Source"])
+        writer.writerows(
+            ["" if (value := getattr(row, attr)) is None else value for attr in attrs] + [timestamp, source]
+            for row in rows
+        )
+        _atomic_write_bytes(csv_path, f.getvalue().encode("utf-8"))
+
+
+def _write_json(payload: Dict, json_path: Path) -> None:
+    """Write ``payload`` to ``json_path`` as indented JSON."""
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(payload, indent=2).encode("utf-8")
+    _atomic_write_bytes(json_path, data)
+
+
+def _parquet_type(column: str):
+    """Return the Arrow type used for ``column`` or None to infer it."""
+    if column in ("Country", "Indicator", "Source"):
+        # Few distinct values repeated on every row: dictionary-encode them
+        return pa.dictionary(pa.int16(), pa.string())
+    if column in ("Current", "Previous", "Difference", "Expected Future", "Surprise"):
+        return pa.float64()
+    if column in ("Published", "Next Release"):
+        return pa.string()
+    if column == "Trend":
+        return pa.list_(pa.float64())
+    if column == "TimestampUTC":
+        return pa.timestamp("s", tz="UTC")
+    return None
+
+
+def _write_parquet(rows: List[MacroRow], path: Path, timestamp: str, source: str) -> None:
+    """Write the result rows to ``path`` as a zstd-compressed Parquet file.
+
+    Columns are collected straight into typed Arrow arrays (no DataFrame
+    intermediate) and written by Arrow's native writer.
+    """
+    data = {column: [getattr(row, attr) for row in rows] for column, attr in _COLUMNS}
+    if any(row.trend is not None for row in rows):
+        data["Trend"] = [row.trend for row in rows]
+    data["TimestampUTC"] = [datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%SZ")] * len(rows)
+    data["Source"] = [source] * len(rows)
+    arrays = [pa.array(values, type=_parquet_type(col)) for col, values in data.items()]
+    batch = pa.RecordBatch.from_arrays(arrays, names=list(data))
+    # Parquet's writer already batches its output; write to a temporary file
+    # and swap it in so a failed write never leaves a truncated file behind
+    tmp = path.with_name(path.name + ".tmp")
+    pq.write_table(pa.Table.from_batches([batch]), tmp, compression="zstd", data_page_size=1 << 20)
+    os.replace(tmp, path)
 
 
 def _format_number(value: Optional[float]) -> str: